@@ -12,6 +12,11 @@ import logging
 import re
 import json
 import datetime
+import bisect
+import contextlib
+import gc
+import itertools
+import numpy as np
 import pandas as pd
 import win32com.client
 import pywintypes
@@ -19,8 +24,9 @@ from bs4 import BeautifulSoup
 from pathlib import Path
 from collections import defaultdict
 
-from outlook_utils import connect_to_outlook, get_default_folder, olFolderInbox
+from outlook_utils import connect_to_outlook, get_default_folder, iter_mail_table, olFolderInbox
 from config import load_config
+from tracking_store import open_email_tracking
 
 # Setup logging
 logging.basicConfig(
@@ -30,10 +36,46 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Prefer the C-accelerated lxml parser; fall back to the stdlib parser if lxml is missing
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+@contextlib.contextmanager
+def _gc_paused():
+    """
+    Disable the cyclic garbage collector for an allocation-heavy, build-and-done phase.
+
+    Report loading and inbox indexing allocate many small dicts/tuples but create no
+    reference cycles, so the generation scans they trigger are pure overhead.
+    Reference counting still frees everything as usual.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+@_gc_paused()
 def load_report_from_html(html_path):
     """Load email data from an HTML report file."""
+    if HTML_PARSER == 'lxml':
+        # pandas parses the table straight through lxml, skipping the BeautifulSoup layer
+        try:
+            tables = pd.read_html(html_path, flavor='lxml', keep_default_na=False)
+        except ValueError as e:
+            raise ValueError(f"Could not find table in HTML report: {e}")
+        data = tables[0].to_dict('records')
+        if not data:
+            raise ValueError("Table has no data rows")
+        return data
+
     with open(html_path, 'r', encoding='utf-8') as f:
-        soup = BeautifulSoup(f.read(), 'html.parser')
+        soup = BeautifulSoup(f, HTML_PARSER)
     
     # Find the table
     table = soup.find('table')
@@ -60,130 +102,421 @@ def load_report_from_html(html_path):
     
     return data
 
+# Report columns the analysis reads. organizer.py writes lowercase names to its CSV,
+# while the HTML report uses the display headers, so both are accepted.
+REPORT_COLUMNS = ['Subject', 'Sender', 'Score', 'Recommended Folder', 'Received']
+REPORT_COLUMN_ALIASES = {
+    'subject': 'Subject',
+    'sender': 'Sender',
+    'score': 'Score',
+    'folder': 'Recommended Folder',
+    'received_time': 'Received',
+}
+REPORT_CSV_DTYPES = {
+    'Subject': 'string',
+    'Sender': 'string',
+    'Score': 'float64',
+    'Recommended Folder': 'string',
+    'Received': 'string',
+}
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+try:
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = 'pyarrow'
+except ImportError:
+    CSV_ENGINE = 'c'
+
+@_gc_paused()
 def load_report_from_csv(csv_path):
-    """Load email data from a CSV report file."""
+    """Load email data from a CSV report file into a DataFrame of the report columns."""
     try:
-        df = pd.read_csv(csv_path)
-        return df.to_dict('records')
+        # Read only the header first so unused columns are never parsed or allocated
+        header = pd.read_csv(csv_path, nrows=0).columns
+        usecols = [c for c in header if REPORT_COLUMN_ALIASES.get(c, c) in REPORT_CSV_DTYPES]
+        dtypes = {c: REPORT_CSV_DTYPES[REPORT_COLUMN_ALIASES.get(c, c)] for c in usecols}
+        df = pd.read_csv(csv_path, usecols=usecols, dtype=dtypes, engine=CSV_ENGINE)
+        return df.rename(columns=REPORT_COLUMN_ALIASES)
     except Exception as e:
         logger.error(f"Error loading CSV report: {e}")
-        return []
+        return pd.DataFrame(columns=REPORT_COLUMNS)
 
-def get_outlook_item_details(inbox, subject, sender=None):
-    """Try to find an Outlook item by subject and return its details."""
-    try:
-        # Get all items in inbox
-        items = inbox.Items
+def _report_frame(report_data):
+    """Return report rows (records or a DataFrame) as a DataFrame with every REPORT_COLUMNS column filled."""
+    if isinstance(report_data, pd.DataFrame):
+        df = report_data
+    else:
+        df = pd.DataFrame.from_records(report_data)
+    df = df.rename(columns=REPORT_COLUMN_ALIASES).reindex(columns=REPORT_COLUMNS)
+    df['Score'] = pd.to_numeric(df['Score'], errors='coerce').fillna(0.0)
+    for column in ('Subject', 'Sender', 'Recommended Folder', 'Received'):
+        values = df[column].astype(object)
+        df[column] = values.where(values.notna(), '')
+    return df
+
+# Number of leading normalized subject characters used to bucket inbox items for fuzzy lookups
+SUBJECT_PREFIX_LEN = 48
+
+# Shortest report subject matched as a substring of an item subject; shorter ones are too noisy
+SUBSTRING_MATCH_MIN_LEN = 5
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+def _norm_subj(subject):
+    """Normalize a subject for matching: trimmed, lowercased, internal whitespace collapsed."""
+    return _WHITESPACE_RE.sub(' ', subject.strip().lower())
+
+# Outlook properties read for each inbox item, with the value used when one is missing
+MAIL_COLUMN_DEFAULTS = {
+    'EntryID': '',
+    'MessageClass': '',
+    'Subject': '',
+    'SenderName': 'Unknown',
+    'SenderEmailAddress': '',
+    'UnRead': False,
+    'ReceivedTime': None,
+    'Importance': 1,
+    'FlagStatus': 0,
+}
+
+def build_report_restrictions(report_df):
+    """
+    Build DASL filters that limit an inbox scan to the date range of a report.
+
+    Senders are deliberately not filtered server-side: report rows also match items
+    whose sender is a substring of the report sender, which a LIKE clause can't
+    express, so sender matching stays client-side in InboxIndex.
+
+    Args:
+        report_df (pd.DataFrame): Report rows as returned by _report_frame.
+
+    Returns:
+        list: DASL filter strings to apply one at a time, or [None] when the report
+              offers nothing to narrow by (no parseable received times).
+    """
+    received = pd.to_datetime(report_df['Received'], errors='coerce').dropna()
+    if received.empty:
+        return [None]
+    
+    # A day of slack covers the local-time vs UTC difference in datereceived
+    since = received.min() - datetime.timedelta(days=1)
+    return [f"@SQL=\"urn:schemas:httpmail:datereceived\" >= '{since.strftime('%m/%d/%Y %I:%M %p')}'"]
+
+def _details_from_row(row):
+    """Build the report-analysis detail dict from a row of MAIL_COLUMN_DEFAULTS properties."""
+    return {
+        'EntryID': row['EntryID'],
+        'Subject': row['Subject'].strip(),
+        'SenderName': row['SenderName'],
+        'SenderEmailAddress': row['SenderEmailAddress'],
+        'Unread': row['UnRead'],  # Critical for our analysis
+        'ReceivedTime': row['ReceivedTime'],
+        'Importance': row['Importance'],
+        'FlagStatus': row['FlagStatus'],
+        'CheckCount': 0  # We'll set this later from email_tracking
+    }
+
+def _is_sender_match(item_sender, item_sender_email, sender):
+    """Flexible sender matching on lowercased values; sender None matches anyone."""
+    return (
+        sender is None or 
+        sender in item_sender or 
+        item_sender in sender or
+        bool(item_sender_email and sender in item_sender_email)
+    )
+
+def _is_subject_match(item_subject, subject):
+    """
+    True if either lowercased subject is a prefix of the other (equality included).
+    Only the shorter string can prefix the longer one, so a single startswith suffices.
+    """
+    if len(item_subject) >= len(subject):
+        return item_subject.startswith(subject)
+    return subject.startswith(item_subject)
+
+def _is_item_match(item_subject, item_sender, item_sender_email, subject, sender):
+    """
+    Apply the report-to-Outlook matching rules. All arguments must already be lowercased;
+    sender may be None to match any sender.
+    """
+    # 1. Subject comparison - ignore trailing spaces, case insensitive
+    # 2. Sender matching - be more flexible
+    return (_is_subject_match(item_subject, subject) and
+            _is_sender_match(item_sender, item_sender_email, sender))
+
+def _iter_restricted_rows(folder, columns, limit, restrictions, seen):
+    """
+    Chain iter_mail_table over each restriction, yielding each mail row newest first
+    with missing values replaced by their MAIL_COLUMN_DEFAULTS and skipping EntryIDs
+    already in seen.
+
+    limit is one row budget shared by all restrictions rather than a limit per
+    restriction, so chaining them doesn't multiply the rows read.
+    """
+    columns = list(columns)
+    defaults = [MAIL_COLUMN_DEFAULTS.get(c) for c in columns]
+    remaining = limit
+    for restriction in restrictions or [None]:
+        if remaining is not None and remaining <= 0:
+            return
+        # Only row values are read, so Items fallbacks can cache just these columns
+        for values, _ in iter_mail_table(folder, columns, limit=remaining, restriction=restriction,
+                                         set_columns=True):
+            if remaining is not None:
+                remaining -= 1
+            row = {c: (values[c] if values[c] is not None else d) for c, d in zip(columns, defaults)}
+            if row['EntryID'] in seen:
+                continue
+            seen.add(row['EntryID'])
+            yield row
+
+class InboxIndex:
+    """
+    In-memory index of inbox mail items, built in one pass, for matching report rows.
+
+    Items are keyed exactly by (normalized subject, sender) and bucketed by the first
+    SUBJECT_PREFIX_LEN characters of the normalized subject. Each bucket entry carries
+    the subject, sender and address already normalized, so lookups never re-normalize.
+    """
+
+    def __init__(self):
+        self.index = {}
+        self.subject_prefix_index = defaultdict(list)
+        self.entries = []  # Same tuples as the buckets, in insertion (newest first) order
+        self._prefix_keys = None
+
+    def add(self, details):
+        """Index one item's details. The first item added wins exact-key collisions."""
+        subject = _norm_subj(details['Subject'])
+        sender = details['SenderName'].lower()
+        sender_email = details['SenderEmailAddress'].lower()
+        self.index.setdefault((subject, sender), details)
+        if sender_email:
+            self.index.setdefault((subject, sender_email), details)
+        entry = (subject, sender, sender_email, details)
+        self.subject_prefix_index[subject[:SUBJECT_PREFIX_LEN]].append(entry)
+        self.entries.append(entry)
+        self._prefix_keys = None
+
+    def _candidate_buckets(self, subject):
+        """Yield every bucket that can hold an item whose subject starts with, or is a prefix of, subject."""
+        key = subject[:SUBJECT_PREFIX_LEN]
+        bucket = self.subject_prefix_index.get(key)
+        if bucket:
+            yield bucket
         
-        # Clean the subject for more reliable matching by removing trailing spaces
-        subject = subject.strip()
+        # Items with shorter subjects that this subject starts with, closest first
+        for length in range(len(key) - 1, 0, -1):
+            bucket = self.subject_prefix_index.get(key[:length])
+            if bucket:
+                yield bucket
         
-        # Create a filter by subject - use a more relaxed filter to find potential matches
-        # Use a more relaxed filter that might catch more potential matches
-        subject_filter = f"@SQL=\"urn:schemas:httpmail:subject\" ci_phrasematch '{subject}'"
-        filtered_items = items.Restrict(subject_filter)
+        # Items with longer subjects that start with a short report subject
+        if len(subject) < SUBJECT_PREFIX_LEN:
+            if self._prefix_keys is None:
+                self._prefix_keys = sorted(self.subject_prefix_index)
+            start = bisect.bisect_right(self._prefix_keys, subject)
+            for prefix in itertools.islice(self._prefix_keys, start, None):
+                if not prefix.startswith(subject):
+                    break
+                yield self.subject_prefix_index[prefix]
+
+    def find(self, subject, sender=None):
+        """
+        Find the item matching a report row's subject and sender.
+
+        Returns:
+            dict: A copy of the matching item's details, or {} if no item matches.
+        """
+        subject = _norm_subj(subject)
+        sender = sender.lower() if sender is not None else None
+        
+        # Fast path: exact subject and sender
+        if sender:
+            details = self.index.get((subject, sender))
+            if details:
+                return dict(details)
+        
+        # Fuzzy path: only items sharing a subject prefix can satisfy the startswith rules
+        for bucket in self._candidate_buckets(subject):
+            for item_subject, item_sender, item_sender_email, details in bucket:
+                if _is_item_match(item_subject, item_sender, item_sender_email, subject, sender):
+                    return dict(details)
         
-        result = {}
-        for item in filtered_items:
-            # Only check mail items
-            if getattr(item, 'Class', 0) != 43:  # 43 = olMail
-                continue
-                
-            item_subject = getattr(item, 'Subject', '').strip()
-            item_sender = getattr(item, 'SenderName', 'Unknown')
-            item_sender_email = getattr(item, 'SenderEmailAddress', '').lower()
-            
-            # Log potential matches for debugging
-            logger.debug(f"Checking match: '{item_subject}' vs '{subject}' from {item_sender}")
-            
-            # More flexible matching:
-            # 1. Subject comparison - ignore trailing spaces, case insensitive
-            subject_matches = (
-                item_subject.lower() == subject.lower() or
-                item_subject.lower().startswith(subject.lower()) or
-                subject.lower().startswith(item_subject.lower())
-            )
-            
-            # 2. Sender matching - be more flexible
-            sender_matches = (
-                sender is None or 
-                sender.lower() in item_sender.lower() or 
-                item_sender.lower() in sender.lower() or
-                (item_sender_email and sender.lower() in item_sender_email)
-            )
-            
-            if subject_matches and sender_matches:
-                # We found a likely match
-                result = {
-                    'EntryID': getattr(item, 'EntryID', ''),
-                    'Subject': item_subject,
-                    'SenderName': item_sender,
-                    'SenderEmailAddress': getattr(item, 'SenderEmailAddress', ''),
-                    'Unread': getattr(item, 'Unread', False),  # Critical for our analysis
-                    'ReceivedTime': getattr(item, 'ReceivedTime', None),
-                    'Importance': getattr(item, 'Importance', 1),
-                    'FlagStatus': getattr(item, 'FlagStatus', 0),
-                    'CheckCount': 0  # We'll set this later from email_tracking
-                }
-                
-                # Print debug info
-                logger.debug(f"Found item: '{item_subject}' from {item_sender}, Unread: {result['Unread']}")
-                break
-                
-        return result
-    except pywintypes.com_error as ce:
-        logger.debug(f"COM error while searching for item: {ce}")
-        return {}
-    except Exception as e:
-        logger.debug(f"Error retrieving Outlook item: {e}")
         return {}
 
-def scan_inbox_status(inbox, limit=100):
-    """Scan the inbox directly to count read vs unread messages."""
-    read_count = 0
-    unread_count = 0
+    def find_containing(self, rows):
+        """
+        Match report subjects that appear inside longer item subjects (forwards, replies)
+        by scanning every item subject once against an Aho-Corasick automaton of all of them.
+
+        Args:
+            rows (dict): Row key -> (normalized subject, lowercased sender or None).
+
+        Returns:
+            dict: Row key -> copy of the first (newest) matching item's details. Empty when
+                  pyahocorasick is not installed.
+        """
+        if ahocorasick is None:
+            return {}
+        
+        rows_by_subject = defaultdict(list)
+        for row, (subject, sender) in rows.items():
+            if len(subject) >= SUBSTRING_MATCH_MIN_LEN:
+                rows_by_subject[subject].append((row, sender))
+        if not rows_by_subject:
+            return {}
+        
+        automaton = ahocorasick.Automaton()
+        for subject, subject_rows in rows_by_subject.items():
+            automaton.add_word(subject, subject_rows)
+        automaton.make_automaton()
+        
+        matches = {}
+        for item_subject, item_sender, item_sender_email, details in self.entries:
+            for _, subject_rows in automaton.iter(item_subject):
+                for row, sender in subject_rows:
+                    if row not in matches and _is_sender_match(item_sender, item_sender_email, sender):
+                        matches[row] = dict(details)
+        return matches
+
+@_gc_paused()
+def build_inbox_index(inbox, limit=None, restrictions=None):
+    """
+    Scan the inbox once and index its mail items for report lookups.
+
+    Args:
+        inbox: Outlook Inbox MAPIFolder.
+        limit (int, optional): Maximum number of (newest) items to index. None indexes all.
+        restrictions (list, optional): DASL filters from build_report_restrictions.
+
+    Returns:
+        InboxIndex: The populated index.
+    """
+    inbox_index = InboxIndex()
     
     try:
-        items = inbox.Items
-        items.Sort("[ReceivedTime]", True)  # Newest first
-        total = items.Count
+        total = inbox.Items.Count
+        count_limit = total if limit is None else min(total, limit)
+        
+        logger.info(f"Indexing inbox: {count_limit} of {total} items...")
+        
+        # Rows arrive newest first, so the newest duplicate wins
+        seen = set()
+        for row in _iter_restricted_rows(inbox, MAIL_COLUMN_DEFAULTS, count_limit, restrictions, seen):
+            inbox_index.add(_details_from_row(row))
+    
+    except Exception as e:
+        logger.error(f"Error indexing inbox: {e}")
+    
+    return inbox_index
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _count_by_sender(sender_ids, unread, num_senders):
+        """Per-sender total/unread counts in one compiled pass over factorized sender ids."""
+        totals = np.zeros(num_senders, dtype=np.int64)
+        unreads = np.zeros(num_senders, dtype=np.int64)
+        for i in range(sender_ids.shape[0]):
+            sender_id = sender_ids[i]
+            if sender_id < 0:  # missing sender, dropped like groupby does
+                continue
+            totals[sender_id] += 1
+            unreads[sender_id] += unread[i]
+        return totals, unreads
+else:
+    _count_by_sender = None
+
+def _aggregate_sender_counts(senders, unread_flags):
+    """
+    Count total/unread/read emails per sender.
+
+    Args:
+        senders: List of sender names, one per scanned email
+        unread_flags: List of unread booleans aligned with senders
+
+    Returns:
+        DataFrame: Indexed by sender in first-seen order, with total, unread and read columns
+    """
+    if _count_by_sender is not None:
+        sender_ids, uniques = pd.factorize(pd.Series(senders, dtype=object), sort=False)
+        totals, unreads = _count_by_sender(sender_ids.astype(np.int64),
+                                           np.asarray(unread_flags, dtype=np.uint8),
+                                           len(uniques))
+        sender_agg = pd.DataFrame({'total': totals, 'unread': unreads},
+                                  index=pd.Index(uniques, name='sender'))
+    else:
+        scan_df = pd.DataFrame({
+            'sender': pd.Series(senders, dtype=object),
+            'unread': pd.Series(unread_flags, dtype=bool),
+        })
+        sender_agg = scan_df.groupby('sender', sort=False)['unread'].agg(total='count', unread='sum')
+    sender_agg['read'] = sender_agg['total'] - sender_agg['unread']
+    return sender_agg
+
+# Number of mixed read/unread senders printed by scan_inbox_status
+MAX_MIXED_SENDERS_SHOWN = 50
+
+def scan_inbox_status(inbox, limit=100, restrictions=None):
+    """
+    Scan the inbox directly to count read vs unread messages.
+
+    restrictions, as built by build_report_restrictions, narrows the scan server-side
+    to the date range a report can refer to.
+    """
+    try:
+        total = inbox.Items.Count
         count_limit = min(total, limit)
         
         logger.info(f"Scanning inbox directly: {count_limit} of {total} items...")
         
-        # Track by sender for additional analysis
-        sender_stats = defaultdict(lambda: {'read': 0, 'unread': 0})
+        # Collect sender/unread columns; per-sender counts are aggregated in one pass below
+        senders = []
+        unread_flags = []
+        
+        seen = set()
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        for row in _iter_restricted_rows(inbox, ['EntryID', 'Subject', 'SenderName', 'UnRead'],
+                                         count_limit, restrictions, seen):
+            senders.append(row['SenderName'])
+            unread_flags.append(bool(row['UnRead']))
+            if debug_enabled and not row['UnRead']:
+                logger.debug("Found READ email: %s from %s", row['Subject'], row['SenderName'])
+        
+        sender_agg = _aggregate_sender_counts(senders, unread_flags)
+        unread_count = int(sender_agg['unread'].sum())
+        read_count = int(sender_agg['read'].sum())
         
-        for i in range(1, count_limit + 1):
-            try:
-                item = items.Item(i)
-                if getattr(item, 'Class', 0) != 43:  # Only count mail items
-                    continue
-                    
-                is_unread = getattr(item, 'Unread', False)
-                sender = getattr(item, 'SenderName', 'Unknown')
-                subject = getattr(item, 'Subject', 'Unknown')
-                
-                if is_unread:
-                    unread_count += 1
-                    sender_stats[sender]['unread'] += 1
-                else:
-                    read_count += 1
-                    sender_stats[sender]['read'] += 1
-                    logger.debug(f"Found READ email: {subject} from {sender}")
-                    
-            except Exception as e:
-                logger.debug(f"Error processing inbox item {i}: {e}")
-                
         # Print senders with both read and unread
         print("\n--- SENDERS WITH MIXED READ/UNREAD STATUS ---")
-        mixed_senders = [(s, stats) for s, stats in sender_stats.items() 
-                          if stats['read'] > 0 and stats['unread'] > 0]
+        mixed_senders = sender_agg[(sender_agg['read'] > 0) & (sender_agg['unread'] > 0)]
         
-        for sender, stats in sorted(mixed_senders, key=lambda x: -(x[1]['read'] + x[1]['unread'])):
+        # Partial selection of the busiest senders rather than a full sort
+        for sender, stats in mixed_senders.nlargest(MAX_MIXED_SENDERS_SHOWN, 'total', keep='first').iterrows():
             print(f"{sender}: {stats['read']} read, {stats['unread']} unread")
+        if len(mixed_senders) > MAX_MIXED_SENDERS_SHOWN:
+            print(f"... and {len(mixed_senders) - MAX_MIXED_SENDERS_SHOWN} more mixed senders")
+        
+        sender_stats = {
+            sender: {'read': int(read), 'unread': int(unread)}
+            for sender, read, unread in zip(sender_agg.index, sender_agg['read'], sender_agg['unread'])
+        }
                 
-        return {'read': read_count, 'unread': unread_count, 'sender_stats': dict(sender_stats)}
+        return {'read': read_count, 'unread': unread_count, 'sender_stats': sender_stats}
             
     except Exception as e:
         logger.error(f"Error scanning inbox: {e}")
@@ -191,15 +524,23 @@ def scan_inbox_status(inbox, limit=100):
 
 def analyze_report(report_data, inbox, config, email_tracking=None):
     """Analyze the report data for proper unread status handling."""
-    if not report_data:
+    report_df = _report_frame(report_data)
+    if report_df.empty:
         logger.error("No report data to analyze")
         return {}
         
+    # Let the store filter the inbox down to the report's date range
+    restrictions = build_report_restrictions(report_df)
+    
     # First scan inbox directly to get read/unread counts
-    inbox_scan = scan_inbox_status(inbox, limit=200)
+    inbox_scan = scan_inbox_status(inbox, limit=200, restrictions=restrictions)
+    
+    # Index the inbox once so each report row is a dict lookup instead of a COM query
+    inbox_index = build_inbox_index(inbox, limit=config.get('max_analysis_emails', 5000),
+                                    restrictions=restrictions)
     
     results = {
-        'total_emails': len(report_data),
+        'total_emails': len(report_df),
         'unread_count': 0,
         'read_count': 0,
         'inbox_scan': inbox_scan,  # Include direct inbox scan results
@@ -226,131 +567,69 @@ def analyze_report(report_data, inbox, config, email_tracking=None):
     expected_unread_impact = message_state_weight * unread_penalty  # Should be negative now
     expected_read_impact = message_state_weight * read_kept_bonus  # Positive
     
-    logger.info(f"Analyzing {len(report_data)} emails from report...")
+    num_rows = len(report_df)
+    logger.info(f"Analyzing {num_rows} emails from report...")
+    
+    # Per-row lookup results, evaluated as vectors once the pass is done
+    scores = report_df['Score'].to_numpy(dtype=np.float64)
+    is_unread = np.zeros(num_rows, dtype=bool)
+    is_read = np.zeros(num_rows, dtype=bool)
+    check_counts = np.ones(num_rows, dtype=np.int64)
+    received_times = [None] * num_rows
     
-    # Loop through each email in the report
-    for i, email in enumerate(report_data):
+    # Rows whose subject only appears inside a longer item subject (e.g. "RE: ...")
+    # are resolved in one multi-pattern pass over the index
+    contained_matches = inbox_index.find_containing({
+        i: (_norm_subj(subject), sender.lower())
+        for i, (subject, sender) in enumerate(zip(report_df['Subject'], report_df['Sender']))
+    })
+    
+    # Loop through each email in the report; columns are already typed and filled.
+    # Debug calls in the loop are guarded so their arguments aren't built when disabled.
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    report_rows = report_df[['Subject', 'Sender', 'Score', 'Recommended Folder']].itertuples(index=False, name=None)
+    for i, (subject, sender, score, folder) in enumerate(report_rows):
         if i % 10 == 0 and i > 0:
-            logger.info(f"Processed {i}/{len(report_data)} emails...")
+            logger.info(f"Processed {i}/{num_rows} emails...")
         
-        # Extract data from report
         try:
-            subject = email.get('Subject', '')
-            sender = email.get('Sender', '')
-            score = float(email.get('Score', 0))
-            folder = email.get('Recommended Folder', '')
-            
             # Log what we're checking
-            logger.debug(f"Checking email: '{subject}' from {sender}")
+            if debug_enabled:
+                logger.debug("Checking email: '%s' from %s", subject, sender)
             
-            # Connect to Outlook and get the actual item's unread status
-            outlook_details = get_outlook_item_details(inbox, subject, sender)
+            # Look up the actual item's unread status in the inbox index
+            outlook_details = inbox_index.find(subject, sender) or contained_matches.get(i, {})
             results['items_checked'] += 1
             
             if outlook_details:
-                results['items_found'] += 1
                 entry_id = outlook_details.get('EntryID', '')
                 unread = outlook_details.get('Unread', False)
                 
                 # Add more verbose debug info
-                logger.debug(f"Found match in Outlook - Subject: '{outlook_details.get('Subject', '')}', " +
-                          f"Sender: {outlook_details.get('SenderName', '')}, Unread: {unread}")
+                if debug_enabled:
+                    logger.debug("Found match in Outlook - Subject: '%s', Sender: %s, Unread: %s",
+                                 outlook_details.get('Subject', ''),
+                                 outlook_details.get('SenderName', ''), unread)
                 
                 # Get check count from email_tracking if available
-                check_count = 1
                 if email_tracking and entry_id and entry_id in email_tracking:
                     track_record = email_tracking[entry_id]
-                    check_count = track_record.get('check_count', 1)
-                    outlook_details['CheckCount'] = check_count
+                    check_counts[i] = track_record.get('check_count', 1)
+                
+                rec_time = outlook_details.get('ReceivedTime')
+                if isinstance(rec_time, (datetime.datetime, pywintypes.TimeType)):
+                    received_times[i] = rec_time.replace(tzinfo=None)
                 
-                # Track by read status
+                # Track by read status; counts are taken from these masks after the loop
                 if unread:
-                    results['unread_count'] += 1
-                    results['unread_scores'].append(score)
-                    results['unread_by_folder'][folder] += 1
-                    
-                    # Track highest/lowest unread
-                    if score > results['highest_unread']['score']:
-                        results['highest_unread'] = {
-                            'score': score,
-                            'subject': subject,
-                            'sender': sender,
-                            'check_count': check_count
-                        }
-                    if score < results['lowest_unread']['score']:
-                        results['lowest_unread'] = {
-                            'score': score,
-                            'subject': subject,
-                            'sender': sender,
-                            'check_count': check_count
-                        }
+                    is_unread[i] = True
                 else:
-                    results['read_count'] += 1
-                    results['read_scores'].append(score)
-                    results['read_by_folder'][folder] += 1
+                    is_read[i] = True
                     
                     # Track this read email for later analysis
-                    logger.debug(f"Counted as READ: '{subject}' from {sender}, Score: {score}, Folder: {folder}")
-                    
-                    # Problem detection: Read email kept in inbox but still has low score
-                    if score < 0.5:  # Read emails should have higher scores with the new logic
-                        results['problems'].append({
-                            'type': 'read_kept_low_score',
-                            'subject': subject,
-                            'sender': sender,
-                            'score': score,
-                            'folder': folder
-                        })
-                
-                # Problem detection: Unread item with high score (with new logic, unread should have lower scores)
-                if unread and score > 0.5:  # Unread items should have lower scores now
-                    results['problems'].append({
-                        'type': 'high_unread_score',
-                        'subject': subject,
-                        'sender': sender,
-                        'score': score,
-                        'folder': folder,
-                        'check_count': check_count
-                    })
-                
-                # Problem detection: Repeatedly ignored (high check_count) but still high score
-                if unread and check_count > 2 and score > 0.4:
-                    # Calculate expected penalty: message_state_weight * ignore_penalty * (check_count-1)
-                    # For example: 0.1 * 0.3 * 2 = 0.06 for check_count=3
-                    expected_penalty = message_state_weight * ignore_penalty * (check_count-1)
-                    max_expected_score = 0.6 - expected_penalty  # 0.6 is a reasonable baseline for an important email
-                    
-                    if score > max_expected_score:
-                        results['problems'].append({
-                            'type': 'ignored_email_high_score',
-                            'subject': subject,
-                            'sender': sender,
-                            'score': score,
-                            'check_count': check_count,
-                            'expected_penalty': expected_penalty,
-                            'max_expected': max_expected_score,
-                            'folder': folder
-                        })
-                    
-                # Problem detection: Very old unread item with high score
-                if unread and outlook_details.get('ReceivedTime'):
-                    rec_time = outlook_details['ReceivedTime']
-                    if isinstance(rec_time, (datetime.datetime, pywintypes.TimeType)):
-                        now = datetime.datetime.now()
-                        try:
-                            days_old = (now - rec_time).days
-                            if days_old > 30 and score > 0.6:  # Old email with high score
-                                results['problems'].append({
-                                    'type': 'old_unread_high_score',
-                                    'subject': subject,
-                                    'sender': sender,
-                                    'score': score,
-                                    'days_old': days_old,
-                                    'check_count': check_count,
-                                    'folder': folder
-                                })
-                        except TypeError:
-                            pass  # Skip if datetime comparison fails
+                    if debug_enabled:
+                        logger.debug("Counted as READ: '%s' from %s, Score: %s, Folder: %s",
+                                     subject, sender, score, folder)
             else:
                 # Track items not found in Outlook
                 results['not_found'].append({
@@ -359,17 +638,92 @@ def analyze_report(report_data, inbox, config, email_tracking=None):
                     'score': score,
                     'folder': folder
                 })
-                logger.debug(f"Could not find email in Outlook: '{subject}' from {sender}")
+                if debug_enabled:
+                    logger.debug("Could not find email in Outlook: '%s' from %s", subject, sender)
                 
         except Exception as e:
-            logger.debug(f"Error processing email {subject}: {e}")
+            logger.debug("Error processing email %s: %s", subject, e)
             continue
     
+    # Read/unread totals and per-folder counts straight from the masks
+    results['unread_count'] = int(is_unread.sum())
+    results['read_count'] = int(is_read.sum())
+    results['items_found'] = results['unread_count'] + results['read_count']
+    folders = report_df['Recommended Folder']
+    for key, mask in (('unread_by_folder', is_unread), ('read_by_folder', is_read)):
+        folder_counts = folders[mask].value_counts(sort=False)
+        results[key].update((folder, int(count)) for folder, count in folder_counts.items())
+    
+    # Problem detection, one vectorized predicate per problem type
+    problem_df = pd.DataFrame({
+        'subject': report_df['Subject'].to_numpy(),
+        'sender': report_df['Sender'].to_numpy(),
+        'score': scores,
+        'folder': report_df['Recommended Folder'].to_numpy(),
+        'check_count': check_counts,
+    })
+    
+    # Read email kept in inbox but still has low score (read emails should score higher)
+    mask_low_read = is_read & (scores < 0.5)
+    
+    # Unread item with high score (with new logic, unread should have lower scores)
+    mask_high_unread = is_unread & (scores > 0.5)
+    
+    # Repeatedly ignored (high check_count) but still high score.
+    # Expected penalty: message_state_weight * ignore_penalty * (check_count-1),
+    # e.g. 0.1 * 0.3 * 2 = 0.06 for check_count=3; 0.6 is a reasonable baseline for an important email
+    problem_df['expected_penalty'] = message_state_weight * ignore_penalty * (check_counts - 1)
+    problem_df['max_expected'] = 0.6 - problem_df['expected_penalty']
+    mask_ignored = (is_unread & (check_counts > 2) & (scores > 0.4)
+                    & (scores > problem_df['max_expected'].to_numpy()))
+    
+    # Very old unread item with high score. "More than 30 whole days old" is the same as
+    # received at or before now - 31 days, so compare against one hoisted cutoff
+    now = pd.Timestamp.now()
+    old_cutoff = now - pd.Timedelta(days=31)
+    received = pd.to_datetime(pd.Series(received_times, dtype=object))
+    mask_old = is_unread & (received <= old_cutoff).to_numpy() & (scores > 0.6)
+    problem_df['days_old'] = pd.Series(pd.NA, index=problem_df.index, dtype='Int64')
+    problem_df.loc[mask_old, 'days_old'] = (now - received[mask_old]).dt.days
+    
+    for problem_type, mask, columns in (
+        ('read_kept_low_score', mask_low_read, ['subject', 'sender', 'score', 'folder']),
+        ('high_unread_score', mask_high_unread, ['subject', 'sender', 'score', 'folder', 'check_count']),
+        ('ignored_email_high_score', mask_ignored, ['subject', 'sender', 'score', 'check_count',
+                                                     'expected_penalty', 'max_expected', 'folder']),
+        ('old_unread_high_score', mask_old, ['subject', 'sender', 'score', 'days_old', 'check_count', 'folder']),
+    ):
+        results['problems'].extend(
+            {'type': problem_type, **problem} for problem in problem_df.loc[mask, columns].to_dict('records'))
+    
     # Calculate averages and differentials
-    if results['unread_scores']:
-        results['unread_avg_score'] = sum(results['unread_scores']) / len(results['unread_scores'])
-    if results['read_scores']:
-        results['read_avg_score'] = sum(results['read_scores']) / len(results['read_scores'])
+    unread_rows = np.flatnonzero(is_unread)
+    unread_scores = scores[unread_rows]
+    read_scores = scores[is_read]
+    results['unread_scores'] = unread_scores.tolist()
+    results['read_scores'] = read_scores.tolist()
+    if unread_scores.size:
+        results['unread_avg_score'] = float(unread_scores.mean())
+        
+        # Track highest/lowest unread (argmax/argmin keep the first row on ties)
+        highest = unread_rows[np.argmax(unread_scores)]
+        if scores[highest] > results['highest_unread']['score']:
+            results['highest_unread'] = {
+                'score': float(scores[highest]),
+                'subject': problem_df.at[highest, 'subject'],
+                'sender': problem_df.at[highest, 'sender'],
+                'check_count': int(check_counts[highest])
+            }
+        lowest = unread_rows[np.argmin(unread_scores)]
+        if scores[lowest] < results['lowest_unread']['score']:
+            results['lowest_unread'] = {
+                'score': float(scores[lowest]),
+                'subject': problem_df.at[lowest, 'subject'],
+                'sender': problem_df.at[lowest, 'sender'],
+                'check_count': int(check_counts[lowest])
+            }
+    if read_scores.size:
+        results['read_avg_score'] = float(read_scores.mean())
     
     # Calculate the average score differential between unread and read
     results['score_differential'] = results['unread_avg_score'] - results['read_avg_score']
@@ -543,6 +897,17 @@ def print_report_analysis(analysis):
     
     print("\n============================================\n")
 
+def _json_default(value):
+    """
+    Serialize values JSON has no type for, identically for the orjson and json encoders.
+
+    Datetimes (including pandas/pywintypes subclasses) become str(value), as the json
+    encoder always wrote them; numpy scalars become plain numbers.
+    """
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
 def save_analysis_to_json(analysis, output_path):
     """Save the analysis results to a JSON file."""
     # Convert defaultdicts to regular dicts for JSON serialization
@@ -550,8 +915,15 @@ def save_analysis_to_json(analysis, output_path):
     analysis_copy['unread_by_folder'] = dict(analysis['unread_by_folder'])
     analysis_copy['read_by_folder'] = dict(analysis['read_by_folder'])
     
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(analysis_copy, f, indent=2, default=str)
+    if orjson is not None:
+        # C encoder; datetimes are passed to _json_default so both encoders write the same text
+        options = (orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+                   | orjson.OPT_PASSTHROUGH_DATETIME)
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(analysis_copy, default=_json_default, option=options))
+    else:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(analysis_copy, f, indent=2, default=_json_default, ensure_ascii=False)
     
     logger.info(f"Analysis saved to {output_path}")
 
@@ -590,7 +962,13 @@ def main():
     email_tracking = None
     data_dir = Path(args.data_dir)
     tracking_file = data_dir / 'email_tracking.pkl'
-    if tracking_file.exists():
+    if (data_dir / 'email_tracking.db').exists():
+        try:
+            email_tracking = open_email_tracking(data_dir)
+            logger.info(f"Opened email tracking store in {data_dir}")
+        except Exception as e:
+            logger.warning(f"Could not open email tracking store: {e}")
+    elif tracking_file.exists():
         try:
             import pickle
             with open(tracking_file, 'rb') as f:
@@ -601,7 +979,8 @@ def main():
     
     # Connect to Outlook
     try:
-        outlook, namespace = connect_to_outlook()
+        # Every Outlook property this script reads uses its exact type library name
+        outlook, namespace = connect_to_outlook(early_bound=True)
         if not namespace:
             logger.error("Failed to connect to Outlook. Exiting.")
             return 1
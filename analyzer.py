@@ -1,19 +1,551 @@
+import bisect
+import functools
 import logging
+import mmap
+import os
 import pickle
+import queue
+import sys
+import threading
 import datetime
 import re
 import numpy as np
 import pandas as pd
+import pythoncom
 import pywintypes
-from collections import defaultdict, Counter
+import win32com.client
+from collections import defaultdict, deque, Counter, OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from datetime import timezone
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow # Parquet engine for pandas
+except ImportError:
+    pyarrow = None
+
 # Assuming outlook_utils provides safe_get_property and folder constants if needed
-from outlook_utils import safe_get_property #, olFolderInbox, olFolderSentMail
+from outlook_utils import safe_get_property, iter_mail_table #, olFolderInbox, olFolderSentMail
+from tracking_store import EmailTrackingStore
 
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns for contact-map building
+_EMAIL_SPLIT_RE = re.compile(r'[._-]')  # email local part -> name components
+_WORD_RE = re.compile(r'\W+')  # display name -> words
+_RE_PREFIX = re.compile(r'^(?:RE|FWD|FW):\s*', re.IGNORECASE)  # one reply/forward prefix of a subject
+
+# Sent item properties read in bulk through the Outlook Table API (see analyze_sent_items)
+SENT_ITEM_COLUMNS = ['EntryID', 'Subject', 'SentOn', 'ConversationID']
+SENT_ITEM_READS_PER_WORKER = 4  # Sent item opens queued per worker thread ahead of the consumer
+# Inbox item properties read in bulk through the Outlook Table API (see analyze_inbox_behavior)
+INBOX_ITEM_COLUMNS = ['EntryID', 'Subject', 'SenderName', 'SenderEmailAddress', 'UnRead',
+                      'ReceivedTime', 'LastModificationTime']
+# Received message properties used to match sent replies to their parents (see _load_conversation_history)
+HISTORY_ITEM_COLUMNS = ['EntryID', 'SenderName', 'SenderEmailAddress', 'ReceivedTime', 'ConversationID']
+# Folders skipped by analyze_folder_structure (add other known system/problematic names here)
+_SKIP_FOLDER_NAMES = frozenset({
+    'Conversation Action Settings', 'Quick Step Settings', 'RSS Feeds', 'Sync Issues',
+    'Conflicts', 'Local Failures', 'Server Failures',
+})
+OL_MAIL_ITEM = 0  # Folder.DefaultItemType of mail folders
+# Item properties read when sampling a folder's contents (see analyze_folder_structure)
+FOLDER_SAMPLE_COLUMNS = ['SenderEmailAddress', 'SenderName', 'ReceivedTime', 'UnRead', 'Subject', 'MessageClass']
+# DASL filter for mail items (MessageClass IPM.Note and its subclasses), applied by Outlook
+MAIL_ITEMS_FILTER = '@SQL="http://schemas.microsoft.com/mapi/proptag/0x001A001F" LIKE \'IPM.Note%\''
+# Largest folder whose Items are sorted for sampling when no Table is available
+FOLDER_SORT_LIMIT = 500
+# Lowercased subject prefixes marking a sent item as a reply or forward, not an initiation
+REPLY_FORWARD_PREFIXES = ("re:", "fw:", "fwd:")
+
+# Write buffer for large pickle files (folder structure without orjson)
+PICKLE_WRITE_BUFFER = 1 << 20
+
+# Resolved Exchange sender addresses kept by EmailAnalyzer._get_sender_address
+EXCHANGE_ADDRESS_CACHE_SIZE = 1024
+
+# Frame magic of zstd-compressed files (see _save_pickle)
+_ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+@functools.lru_cache(maxsize=1 << 16)
+def _pywin_to_naive(time_obj):
+    """Convert a (hashable) pywintypes.TimeType to a naive datetime, or None on failure."""
+    # Build directly from the date/time attributes - no string round trip
+    try:
+        return datetime.datetime(
+            time_obj.year, time_obj.month, time_obj.day,
+            time_obj.hour, time_obj.minute, time_obj.second,
+            getattr(time_obj, 'microsecond', 0), # Include microseconds if possible
+            tzinfo=None # Ensure naive
+        )
+    except (AttributeError, ValueError, TypeError) as prop_err:
+        logger.debug(f"Could not convert pywintypes time {time_obj} using properties: {prop_err}. Trying Format method...")
+        # Fallback to formatting if the attributes are unavailable
+        try:
+            # Format: YYYY-MM-DD HH:MM:SS (ISO compatible subset)
+            time_str = time_obj.Format('%Y-%m-%d %H:%M:%S')
+            # Microseconds are lost, but guarantees standard datetime
+            return datetime.datetime.strptime(time_str, '%Y-%m-%d %H:%M:%S')
+        except Exception as format_err:
+            logger.error(f"Failed to convert pywintypes time {time_obj} using Format method: {format_err}")
+            return None # Give up if both methods fail
+
+def _score_name_email(name, name_words, email_local, debug_enabled=False):
+    """
+    Score how well an email local part matches a lowercased display name.
+
+    Args:
+        name (str): Lowercased display name
+        name_words (list): Words of the name longer than two characters
+        email_local (str): Lowercased part of the email before '@'
+        debug_enabled (bool): Log the contribution of each rule
+
+    Returns:
+        int: Match score; higher is a better match
+    """
+    email_local_parts = _EMAIL_SPLIT_RE.split(email_local)
+    score = 0
+    
+    # Check each word in name against email
+    for word in name_words:
+        if word in email_local:
+            score += 2  # Direct match is strongest
+            if debug_enabled:
+                logger.debug("  Word '%s' direct match in '%s' +2 points", word, email_local)
+        elif any(word in part for part in email_local_parts):
+            score += 1  # Partial match
+            if debug_enabled:
+                logger.debug("  Word '%s' partial match in '%s' +1 point", word, email_local)
+    
+    # Check each part of email against name
+    for part in email_local_parts:
+        if len(part) > 2 and part in name:
+            score += 2  # Direct match
+            if debug_enabled:
+                logger.debug("  Email part '%s' direct match in '%s' +2 points", part, name)
+        elif any(part in word for word in name_words):
+            score += 1  # Partial match
+            if debug_enabled:
+                logger.debug("  Email part '%s' partial match in '%s' +1 point", part, name)
+    
+    # Names exactly matching email local parts get highest score
+    # e.g., "john.doe@example.com" with "John Doe"
+    if ''.join(name_words) == email_local.replace('.', '').replace('-', '').replace('_', ''):
+        score += 5
+        if debug_enabled:
+            logger.debug("  Full name match pattern for '%s' and '%s' +5 points", name, email_local)
+        
+    # First initial + last name pattern (j.smith@example.com with "John Smith")
+    if (len(name_words) > 1 and 
+        email_local.startswith(name_words[0][0]) and 
+        email_local[1:].startswith(name_words[-1])):
+        score += 4
+        if debug_enabled:
+            logger.debug("  First initial + last name pattern for '%s' and '%s' +4 points", name, email_local)
+    
+    return score
+
+def _to_codepoints(text):
+    """UTF-32 code point array of text, for the compiled scorer."""
+    return np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+
+def _pack_strings(strings):
+    """Concatenate strings into one code point array plus an offsets array (len+1)."""
+    offsets = np.zeros(len(strings) + 1, dtype=np.int64)
+    np.cumsum([len(text) for text in strings], out=offsets[1:])
+    return _to_codepoints(''.join(strings)), offsets
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _contains(hay, hay_start, hay_end, needle, needle_start, needle_end):
+        """str.__contains__ over code point slices; the empty needle is always found."""
+        n = needle_end - needle_start
+        for i in range(hay_start, hay_end - n + 1):
+            j = 0
+            while j < n and hay[i + j] == needle[needle_start + j]:
+                j += 1
+            if j == n:
+                return True
+        return False
+
+    @numba.njit(cache=True)
+    def _local_part_bounds(local, start, end):
+        """Start/end of each piece of local[start:end] split on '.', '_' and '-'."""
+        bounds = [(start, start)]
+        bounds.pop()
+        piece_start = start
+        for i in range(start, end):
+            c = local[i]
+            if c == 46 or c == 95 or c == 45:  # '.', '_', '-'
+                bounds.append((piece_start, i))
+                piece_start = i + 1
+        bounds.append((piece_start, end))
+        return bounds
+
+    @numba.njit(cache=True)
+    def _score_candidates_jit(name, words, word_offsets, locals_, local_offsets, candidates):
+        """
+        Compiled _score_name_email for one name against several email local parts.
+
+        Strings are passed as UTF-32 code point arrays: name whole, the name words and
+        all local parts packed with offsets (see _pack_strings). candidates holds the
+        indexes of the local parts to score; the scores are returned in that order.
+        """
+        num_words = word_offsets.shape[0] - 1
+        scores = np.zeros(candidates.shape[0], dtype=np.int64)
+        for c in range(candidates.shape[0]):
+            ls = local_offsets[candidates[c]]
+            le = local_offsets[candidates[c] + 1]
+            parts = _local_part_bounds(locals_, ls, le)
+            score = 0
+            
+            # Check each word in name against email
+            for w in range(num_words):
+                ws, we = word_offsets[w], word_offsets[w + 1]
+                if _contains(locals_, ls, le, words, ws, we):
+                    score += 2
+                else:
+                    for ps, pe in parts:
+                        if _contains(locals_, ps, pe, words, ws, we):
+                            score += 1
+                            break
+            
+            # Check each part of email against name
+            for ps, pe in parts:
+                if pe - ps > 2 and _contains(name, 0, name.shape[0], locals_, ps, pe):
+                    score += 2
+                else:
+                    for w in range(num_words):
+                        if _contains(words, word_offsets[w], word_offsets[w + 1], locals_, ps, pe):
+                            score += 1
+                            break
+            
+            # Joined name words equal the local part without separators
+            full_match = True
+            k = 0
+            for i in range(ls, le):
+                ch = locals_[i]
+                if ch == 46 or ch == 95 or ch == 45:
+                    continue
+                if k >= words.shape[0] or words[k] != ch:
+                    full_match = False
+                    break
+                k += 1
+            if full_match and k == words.shape[0]:
+                score += 5
+            
+            # First initial + last name
+            if num_words > 1 and le - ls > 0 and locals_[ls] == words[0]:
+                last_start, last_end = word_offsets[num_words - 1], word_offsets[num_words]
+                n = last_end - last_start
+                if le - ls - 1 >= n:
+                    prefix = True
+                    for j in range(n):
+                        if locals_[ls + 1 + j] != words[last_start + j]:
+                            prefix = False
+                            break
+                    if prefix:
+                        score += 4
+            
+            scores[c] = score
+        return scores
+else:
+    _score_candidates_jit = None
+
+def _load_pickle(path):
+    """
+    Unpickle a file straight from a read-only memory map, without reading it into a
+    buffer first. zstd-compressed files written by _save_pickle are detected by their
+    magic bytes and decompressed transparently.
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raise EOFError(f"{path} is empty")  # mmap can't map an empty file
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm[:4] == _ZSTD_MAGIC:
+                if zstandard is None:
+                    raise pickle.UnpicklingError(f"{path} is zstd-compressed but zstandard is not installed")
+                with zstandard.ZstdDecompressor().stream_reader(mm) as reader:
+                    return pickle.load(reader)
+            return pickle.loads(mm)
+
+def _save_pickle(path, obj, compress=False, buffering=-1):
+    """
+    Pickle obj to path atomically: write a temp file next to it, then os.replace it
+    over the destination, so a crash never leaves a truncated file behind.
+
+    Args:
+        path (Path): Destination file
+        obj: Object to pickle
+        compress (bool): zstd-compress when zstandard is installed. Only for files
+            that no script outside this module reads with plain pickle.load.
+        buffering (int): Write buffer size for the temp file (-1 for the default)
+    """
+    tmp_path = path.with_name(path.name + '.tmp')
+    try:
+        with open(tmp_path, 'wb', buffering=buffering) as f:
+            if compress and zstandard is not None:
+                with zstandard.ZstdCompressor(level=3).stream_writer(f, closefd=False) as zf:
+                    pickle.dump(obj, zf, protocol=pickle.HIGHEST_PROTOCOL)
+            else:
+                pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+# Per-thread COM state for worker threads that open Outlook items
+_com_thread = threading.local()
+
+class _ComThreadPool:
+    """
+    Worker threads for Outlook reads, each in its own COM apartment with its own
+    MAPI session (_com_thread.namespace).
+
+    Each thread runs one long-lived task loop, so unlike a ThreadPoolExecutor
+    initializer it can release its session and leave its apartment
+    (CoUninitialize) when the pool shuts down. submit() returns a
+    concurrent.futures.Future; use as a context manager or call shutdown().
+    """
+
+    def __init__(self, max_workers):
+        self._tasks = queue.SimpleQueue()
+        self._threads = [threading.Thread(target=self._worker, daemon=True) for _ in range(max_workers)]
+        for thread in self._threads:
+            thread.start()
+
+    def _worker(self):
+        pythoncom.CoInitialize()
+        try:
+            try:
+                _com_thread.namespace = win32com.client.Dispatch("Outlook.Application").GetNamespace("MAPI")
+            except Exception as e:
+                logger.warning(f"Worker thread could not open a MAPI session: {e}")
+                _com_thread.namespace = None # Tasks on this thread fail and are reported by their callers
+            while True:
+                task = self._tasks.get()
+                if task is None:
+                    break
+                future, fn, args = task
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    future.set_result(fn(*args))
+                except BaseException as e:
+                    future.set_exception(e)
+                del task, future # Don't hold the last result's COM objects
+        finally:
+            # Release the session's COM objects before leaving the apartment
+            _com_thread.__dict__.pop('namespace', None)
+            pythoncom.CoUninitialize()
+
+    def submit(self, fn, *args):
+        """Run fn(*args) on a worker thread and return its Future."""
+        future = Future()
+        self._tasks.put((future, fn, args))
+        return future
+
+    def shutdown(self):
+        """Finish queued tasks, then stop every worker thread and wait for it."""
+        for _ in self._threads:
+            self._tasks.put(None)
+        for thread in self._threads:
+            thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+
+def _sent_item_details(item):
+    """
+    Read the properties of a sent mail item that its folder's Table cannot return.
+
+    Args:
+        item: Outlook mail item
+
+    Returns:
+        tuple: ([(recipient type, raw address or name), ...], body length).
+            Recipient type is olTo = 1, olCC = 2 or olBCC = 3.
+    """
+    raw_recipients = []
+    try:
+        # Indexed Item(i) access; iterating the COM collection is slower
+        recipients = item.Recipients
+        for recipient_index in range(1, recipients.Count + 1):
+            recipient = recipients.Item(recipient_index)
+            recipient_type = getattr(recipient, 'Type', 1)
+            # Normalize address - prefer Address if available, else Name
+            address = getattr(recipient, 'Address', None)
+            name = getattr(recipient, 'Name', 'Unknown')
+            raw_recipients.append((recipient_type, address if address and '@' in address else name))
+    except pywintypes.com_error as r_ce:
+        logger.debug(f"COM Error accessing recipients for '{getattr(item, 'Subject', '?')}': {r_ce}")
+    return raw_recipients, len(getattr(item, 'Body', ''))
+
+def _read_sent_item(entry_id):
+    """Open a sent item by EntryID on a _ComThreadPool thread and read its details, or None on error."""
+    try:
+        return _sent_item_details(_com_thread.namespace.GetItemFromID(entry_id))
+    except Exception as e:
+        logger.debug(f"Error opening sent item {entry_id}: {e}")
+        return None
+
+def _iter_sent_item_details(executor, sent_rows, max_in_flight):
+    """
+    Yield (row, details, sent time) for each of sent_rows in order, reading the details
+    of rows that have none yet with _read_sent_item on executor.
+
+    At most max_in_flight reads are submitted ahead of the consumer, so only that many
+    results are held in memory however many rows there are.
+
+    Args:
+        executor: _ComThreadPool to read the details on.
+        sent_rows (list): (row, details or None, sent time) tuples.
+        max_in_flight (int): Maximum number of submitted, unconsumed reads.
+    """
+    pending = deque() # (row, details, sent time, future or None), in row order
+    in_flight = 0
+    for row, details, sent_on in sent_rows:
+        future = executor.submit(_read_sent_item, row['EntryID']) if details is None else None
+        if future is not None:
+            in_flight += 1
+        pending.append((row, details, sent_on, future))
+        while in_flight >= max_in_flight:
+            row, details, sent_on, future = pending.popleft()
+            if future is not None:
+                in_flight -= 1
+                details = future.result()
+            yield row, details, sent_on
+    while pending:
+        row, details, sent_on, future = pending.popleft()
+        yield row, (future.result() if future is not None else details), sent_on
+
+def _latest_datetime(dates):
+    """
+    Return the latest datetime in dates, or None if there is none.
+
+    Non-datetime values (None, or anything that slipped into saved data) are ignored;
+    the common all-datetime case is a single C-level max().
+    """
+    try:
+        latest = max(dates, default=None)
+    except TypeError: # Mixed types
+        latest = None
+    if isinstance(latest, datetime.datetime):
+        return latest
+    return max((d for d in dates if isinstance(d, datetime.datetime)), default=None)
+
+def _save_json(path, obj):
+    """
+    Write a dict of primitives (str/number/bool/None, lists and nested dicts) to
+    path as orjson-encoded JSON, atomically like _save_pickle.
+
+    Args:
+        path (Path): Destination file
+        obj: Object to encode
+
+    Raises:
+        TypeError: If obj holds values JSON cannot represent (e.g. non-str keys)
+    """
+    data = orjson.dumps(obj)  # Encode first: nothing is written if this fails
+    tmp_path = path.with_name(path.name + '.tmp')
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+def _load_data_file(path):
+    """ Load a file written by _save_json (.json) or _save_pickle (anything else). """
+    if path.suffix == '.json':
+        return orjson.loads(path.read_bytes())
+    return _load_pickle(path)
+
+def _save_parquet_records(path, records):
+    """
+    Write a {key: {column: value}} dict to a Parquet file, one row per key,
+    atomically like _save_pickle.
+
+    Args:
+        path (Path): Destination file
+        records (dict): Row key -> dict of primitive / datetime values
+    """
+    frame = pd.DataFrame.from_dict(records, orient='index')
+    tmp_path = path.with_name(path.name + '.tmp')
+    try:
+        frame.to_parquet(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+def _load_parquet_records(path):
+    """ Load a file written by _save_parquet_records back into a dict of dicts with naive datetimes. """
+    frame = pd.read_parquet(path)
+    time_columns = [c for c in frame.columns if pd.api.types.is_datetime64_any_dtype(frame[c])]
+    records = frame.to_dict('index')
+    for record in records.values():
+        for column in time_columns:
+            value = record[column]
+            record[column] = None if pd.isna(value) else value.to_pydatetime()
+    return records
+
+def _sender_scores_file(data_dir, config):
+    """
+    Path of the saved sender scores: the Parquet file when pyarrow is available,
+    sender_scores_use_pickle is off and it exists, otherwise the pickle file.
+
+    Args:
+        data_dir (Path): Directory holding the analysis data
+        config (dict): Application configuration
+    """
+    parquet_file = Path(data_dir) / 'sender_scores.parquet'
+    if pyarrow is None or config.get('sender_scores_use_pickle', False) or not parquet_file.exists():
+        return parquet_file.with_suffix('.pkl')
+    return parquet_file
+
+def _load_sender_scores_file(path):
+    """ Load a sender scores file chosen by _sender_scores_file. """
+    if path.suffix == '.parquet':
+        return _load_parquet_records(path)
+    return _load_pickle(path)
+
+def _substring_index(texts, lengths):
+    """
+    Index every substring of the given lengths back to the keys whose text contains it.
+
+    Args:
+        texts (dict): Maps key -> text to index
+        lengths (set): Substring lengths to index (0 maps '' to every key)
+
+    Returns:
+        defaultdict: Maps substring -> set of keys whose text contains it
+    """
+    index = defaultdict(set)
+    for key, text in texts.items():
+        for size in lengths:
+            for start in range(len(text) - size + 1):
+                index[text[start:start + size]].add(key)
+    return index
+
 class EmailAnalyzer:
     """
     Analyzes Outlook email data including sent items, inbox behavior,
@@ -37,51 +569,121 @@ class EmailAnalyzer:
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
 
-        # Internal state for analysis results
-        self.sender_scores = {}
-        self.email_patterns = {} # Will store inbox behavior results
-        self.folder_structure = {}
-        self.email_tracking = {} # For tracking read status across runs
-        self.conversation_history = defaultdict(list) # Stores {conv_id: [ {received_time: dt, sender: str, entry_id: str}, ... ]}
-        
-        # Contact normalization map to resolve duplicate identities
-        self.contact_map = {} # Maps display names to email addresses
-        
-        # Load existing data if available
-        self._load_analysis_data()
-        
-        # Initialize contact map now that we have loaded the email_tracking data
+        # Internal state for analysis results. sender_scores, email_patterns,
+        # folder_structure, email_tracking and contact_map are loaded from disk
+        # lazily, on first access (see the cached properties below).
+        self._exchange_address_cache = OrderedDict() # Exchange DN -> SMTP address (or None), LRU
+        self._normalized_contacts = {} # Raw contact -> _normalize_contact result; cleared when contact_map changes
+        # {conv_id: {'times': [received_time, ...], 'msgs': [{received_time: dt, sender: str, entry_id: str}, ...]}},
+        # both lists kept sorted by received_time (see _add_to_conversation_history)
+        self.conversation_history = defaultdict(lambda: {'times': [], 'msgs': []})
+
+    @functools.cached_property
+    def email_tracking(self):
+        """Tracking records for read status across runs, loaded on first access."""
+        return self._load_email_tracking()
+
+    @functools.cached_property
+    def sender_scores(self):
+        """Sender importance scores, loaded on first access."""
+        return self._load_sender_scores()
+
+    @functools.cached_property
+    def email_patterns(self):
+        """Inbox behavior results, loaded on first access."""
+        return self._load_inbox_behavior()
+
+    @functools.cached_property
+    def folder_structure(self):
+        """Folder structure analysis, loaded on first access."""
+        return self._load_folder_structure()
+
+    @functools.cached_property
+    def contact_map(self):
+        """
+        Contact normalization map (display name -> email address) used to resolve
+        duplicate identities. Loaded on first access and built from the email
+        tracking data if nothing was saved.
+        """
+        # Set the instance attribute first: _initialize_contact_map reads and fills it
+        self.contact_map = self._load_contact_map()
         self._initialize_contact_map()
+        return self.contact_map
 
-    def _load_analysis_data(self):
-        """ Load previously saved analysis data from pickle files, including post-load validation. """
+    def load_analysis_data(self, attrs=None):
+        """
+        Eagerly load previously saved analysis data (normally loaded on first access).
+
+        The files are independent, so they are read concurrently; the contact map is
+        completed from the tracking data once everything is loaded. Results fill the
+        same cached properties that lazy access would.
+
+        Args:
+            attrs (iterable, optional): Names of the properties to load, e.g.
+                ('sender_scores', 'email_patterns'). Loads all of them if None.
+        """
+        loaders = {
+            'email_tracking': self._load_email_tracking,
+            'sender_scores': self._load_sender_scores,
+            'contact_map': self._load_contact_map,
+            'email_patterns': self._load_inbox_behavior,
+            'folder_structure': self._load_folder_structure,
+        }
+        if attrs is not None:
+            loaders = {attr: loaders[attr] for attr in attrs}
+        pending = {attr: loader for attr, loader in loaders.items() if attr not in self.__dict__}
+        if not pending:
+            return
+        with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+            futures = {attr: executor.submit(loader) for attr, loader in pending.items()}
+        for attr, future in futures.items():
+            setattr(self, attr, future.result())
+        if 'contact_map' in futures:
+            self._initialize_contact_map()
+
+    def _load_email_tracking(self):
+        """
+        Open the SQLite email tracking store. Records are read and written one row
+        at a time, so nothing is loaded up front; a legacy email_tracking.pkl is
+        imported the first time the store is created.
+        """
+        db_file = self.data_dir / 'email_tracking.db'
+        is_new = not db_file.exists()
+        store = EmailTrackingStore(db_file)
+        logger.info(f"Opened email tracking store {db_file}")
+        if is_new:
+            legacy_tracking = self._load_legacy_email_tracking()
+            if legacy_tracking:
+                store.update(legacy_tracking)
+                logger.info(f"Imported {len(legacy_tracking)} records from email_tracking.pkl into {db_file}")
+        return store
+
+    def _load_legacy_email_tracking(self):
+        """ Load email tracking data from the old pickle file, including post-load validation. """
         # --- Load Email Tracking Data ---
         tracking_file = self.data_dir / 'email_tracking.pkl'
         if tracking_file.exists():
             try:
-                with open(tracking_file, 'rb') as f:
-                    loaded_tracking = pickle.load(f)
+                loaded_tracking = _load_pickle(tracking_file)
 
-                # Post-load validation and conversion for tracking data
-                validated_tracking = {}
+                # Post-load validation and conversion for tracking data,
+                # converted one timestamp column at a time. The freshly unpickled
+                # records are not shared with anything, so they are fixed in place.
                 conversion_needed = False
-                for entry_id, record in loaded_tracking.items():
-                    validated_record = record.copy()
-                    for key in ['received_time', 'last_modified', 'last_checked', 'first_opened_time', 'sent_on_time']:
-                        if key in validated_record and validated_record[key] is not None:
-                            original_value = validated_record[key]
-                            converted_value = self._convert_to_naive_datetime(original_value)
-                            if converted_value is None:
-                                logger.warning(f"Post-load conversion failed for '{key}' in {entry_id}. Removing timestamp.")
-                                validated_record[key] = None
-                                conversion_needed = True
-                            elif original_value is not converted_value:
-                                validated_record[key] = converted_value
-                                conversion_needed = True # Mark if actual conversion happened
-
-                    validated_tracking[entry_id] = validated_record
-
-                self.email_tracking = validated_tracking
+                for key in ['received_time', 'last_modified', 'last_checked', 'first_opened_time', 'sent_on_time']:
+                    present = [(entry_id, record) for entry_id, record in loaded_tracking.items()
+                               if record.get(key) is not None]
+                    converted_values = self._convert_to_naive_datetimes([record[key] for _, record in present])
+                    for (entry_id, record), converted_value in zip(present, converted_values):
+                        if converted_value is None:
+                            logger.warning(f"Post-load conversion failed for '{key}' in {entry_id}. Removing timestamp.")
+                            record[key] = None
+                            conversion_needed = True
+                        elif record[key] is not converted_value:
+                            record[key] = converted_value
+                            conversion_needed = True # Mark if actual conversion happened
+
+                email_tracking = loaded_tracking
                 if conversion_needed:
                     logger.info(f"Performed post-load timestamp conversion/validation for {tracking_file}")
                 else:
@@ -89,20 +691,22 @@ class EmailAnalyzer:
 
             except (EOFError, pickle.UnpicklingError) as load_err:
                  logger.warning(f"Could not load email tracking file '{tracking_file}': {load_err}. Starting fresh.")
-                 self.email_tracking = {}
+                 email_tracking = {}
             except Exception as e:
                  logger.warning(f"Error loading email tracking file '{tracking_file}': {e}. Starting fresh.")
-                 self.email_tracking = {}
+                 email_tracking = {}
         else:
-            self.email_tracking = {}
+            email_tracking = {}
             logger.info("Email tracking file not found. Starting fresh.")
+        return email_tracking
 
+    def _load_sender_scores(self):
+        """ Load sender scores from their Parquet or pickle file, including post-load validation. """
         # --- Load Sender Scores Data ---
-        sender_scores_file = self.data_dir / 'sender_scores.pkl'
+        sender_scores_file = _sender_scores_file(self.data_dir, self.config)
         if sender_scores_file.exists():
             try:
-                 with open(sender_scores_file, 'rb') as f:
-                     loaded_scores = pickle.load(f)
+                 loaded_scores = _load_sender_scores_file(sender_scores_file)
 
                  # Post-load validation and conversion for sender scores
                  validated_scores = {}
@@ -122,7 +726,7 @@ class EmailAnalyzer:
                                conversion_needed_scores = True
                      validated_scores[sender] = validated_score_data
 
-                 self.sender_scores = validated_scores
+                 sender_scores = validated_scores
                  if conversion_needed_scores:
                      logger.info(f"Performed post-load timestamp conversion/validation for {sender_scores_file}")
                  else:
@@ -130,60 +734,78 @@ class EmailAnalyzer:
 
             except (EOFError, pickle.UnpicklingError) as load_err:
                 logger.warning(f"Could not load sender scores file '{sender_scores_file}': {load_err}. Starting fresh.")
-                self.sender_scores = {}
+                sender_scores = {}
             except Exception as e:
                 logger.warning(f"Error loading sender scores file '{sender_scores_file}': {e}. Starting fresh.")
-                self.sender_scores = {}
+                sender_scores = {}
         else:
-             self.sender_scores = {}
+             sender_scores = {}
              logger.info("Sender scores file not found. Starting fresh.")
+        return sender_scores
+
+    def _data_file(self, name, use_pickle=False):
+        """
+        Path of a saved analysis cache: the JSON file when orjson is available and it
+        exists, otherwise the pickle file written before (or without) orjson.
+        use_pickle selects the pickle file regardless.
+        """
+        json_file = self.data_dir / f'{name}.json'
+        if orjson is not None and not use_pickle and json_file.exists():
+            return json_file
+        return self.data_dir / f'{name}.pkl'
 
+    def _load_contact_map(self):
+        """ Load the saved contact normalization map. """
         # --- Load Contact Map Data ---
-        contact_map_file = self.data_dir / 'contact_map.pkl'
+        contact_map_file = self._data_file('contact_map')
         if contact_map_file.exists():
             try:
-                with open(contact_map_file, 'rb') as f:
-                    self.contact_map = pickle.load(f)
-                logger.info(f"Loaded contact map from {contact_map_file} with {len(self.contact_map)} mappings")
+                contact_map = _load_data_file(contact_map_file)
+                logger.info(f"Loaded contact map from {contact_map_file} with {len(contact_map)} mappings")
             except Exception as e:
                 logger.warning(f"Error loading contact map file '{contact_map_file}': {e}. Starting fresh.")
-                self.contact_map = {}
+                contact_map = {}
         else:
-             self.contact_map = {}
+             contact_map = {}
              logger.info("Contact map file not found. Starting fresh.")
+        return contact_map
 
+    def _load_inbox_behavior(self):
+        """ Load inbox behavior data. """
         # --- Load Inbox Behavior Data --- (No timestamps stored directly)
-        inbox_behavior_file = self.data_dir / 'inbox_behavior.pkl'
+        inbox_behavior_file = self._data_file('inbox_behavior')
         if inbox_behavior_file.exists():
              try:
-                with open(inbox_behavior_file, 'rb') as f:
-                    loaded_patterns = pickle.load(f)
-                    self.email_patterns = loaded_patterns
+                email_patterns = _load_data_file(inbox_behavior_file)
                 logger.info(f"Loaded inbox behavior data from {inbox_behavior_file}")
              except Exception as e:
                 logger.warning(f"Could not load inbox behavior file '{inbox_behavior_file}': {e}")
-                self.email_patterns = {}
+                email_patterns = {}
                 # Ensure the nested dict for read/kept stats exists if loading old data
-                if 'sender_read_kept_stats' not in self.email_patterns:
-                    self.email_patterns['sender_read_kept_stats'] = {}
+                if 'sender_read_kept_stats' not in email_patterns:
+                    email_patterns['sender_read_kept_stats'] = {}
         else:
-             self.email_patterns = {}
-             self.email_patterns['sender_read_kept_stats'] = {} # Initialize if file doesn't exist
+             email_patterns = {}
+             email_patterns['sender_read_kept_stats'] = {} # Initialize if file doesn't exist
              logger.info("Inbox behavior file not found. Starting fresh.")
+        return email_patterns
 
+    def _load_folder_structure(self):
+        """ Load folder structure data. """
         # --- Load Folder Structure Data --- (No timestamps stored directly)
-        folder_structure_file = self.data_dir / 'folder_structure.pkl'
+        folder_structure_file = self._data_file('folder_structure',
+                                                self.config.get('folder_structure_use_pickle', False))
         if folder_structure_file.exists():
              try:
-                 with open(folder_structure_file, 'rb') as f:
-                     self.folder_structure = pickle.load(f)
+                 folder_structure = _load_data_file(folder_structure_file)
                  logger.info(f"Loaded folder structure data from {folder_structure_file}")
              except Exception as e:
                  logger.warning(f"Could not load folder structure file '{folder_structure_file}': {e}")
-                 self.folder_structure = {}
+                 folder_structure = {}
         else:
-            self.folder_structure = {}
+            folder_structure = {}
             logger.info("Folder structure file not found. Starting fresh.")
+        return folder_structure
 
     def _convert_to_naive_datetime(self, time_obj):
         """Converts pywintypes.TimeType or datetime.datetime to a naive Python datetime."""
@@ -191,27 +813,8 @@ class EmailAnalyzer:
             # If already datetime, just make naive
             return time_obj.replace(tzinfo=None)
         elif isinstance(time_obj, pywintypes.TimeType):
-            # Explicitly convert pywintypes.TimeType to datetime.datetime
-            try:
-                # Convert via formatting, which might be more robust
-                # Format: YYYY-MM-DD HH:MM:SS (ISO compatible subset)
-                time_str = time_obj.Format('%Y-%m-%d %H:%M:%S')
-                dt = datetime.datetime.strptime(time_str, '%Y-%m-%d %H:%M:%S')
-                # Microseconds might be lost, but guarantees standard datetime
-                return dt
-            except Exception as format_err:
-                 logger.debug(f"Could not convert pywintypes time {time_obj} using Format method: {format_err}. Trying property access...")
-                 # Fallback to property access if Format fails
-                 try:
-                     return datetime.datetime(
-                         time_obj.year, time_obj.month, time_obj.day,
-                         time_obj.hour, time_obj.minute, time_obj.second,
-                         getattr(time_obj, 'microsecond', 0), # Include microseconds if possible
-                         tzinfo=None # Ensure naive
-                     )
-                 except Exception as prop_err:
-                      logger.error(f"Failed to convert pywintypes time {time_obj} using properties: {prop_err}")
-                      return None # Give up if both methods fail
+            # Cached per distinct value; batches of mail often share timestamps
+            return _pywin_to_naive(time_obj)
 
         # Try parsing LAST if it's some other type (e.g., string) and not None
         elif time_obj:
@@ -229,6 +832,59 @@ class EmailAnalyzer:
 
         return None # Return None if input is None or conversion failed
 
+    def _convert_to_naive_datetimes(self, values):
+        """
+        Convert a column of timestamp values like _convert_to_naive_datetime, in bulk.
+
+        Datetimes and pywintypes times are converted individually (cheap); everything
+        else is parsed in a single pandas call instead of one pd.to_datetime per value.
+
+        Args:
+            values (list): Timestamp values (datetime, pywintypes.TimeType, str, ...)
+
+        Returns:
+            list: Naive datetimes aligned with values, None where conversion failed
+        """
+        converted = [None] * len(values)
+        to_parse = []  # (position, string) pairs for pandas
+        for i, time_obj in enumerate(values):
+            if isinstance(time_obj, (datetime.datetime, pywintypes.TimeType)):
+                converted[i] = self._convert_to_naive_datetime(time_obj)
+            elif time_obj:
+                to_parse.append((i, str(time_obj)))
+
+        if to_parse:
+            # utc=True converts aware values to UTC and leaves naive ones as-is,
+            # then tz_localize(None) drops the zone - same as the scalar path
+            parsed = pd.to_datetime(pd.Series([text for _, text in to_parse], dtype=object),
+                                    errors='coerce', utc=True, format='mixed').dt.tz_localize(None)
+            for (i, _), dt_obj in zip(to_parse, parsed):
+                if not pd.isna(dt_obj):
+                    converted[i] = dt_obj
+        return converted
+
+    def _tracking_sender_frame(self):
+        """
+        Sender fields of every email tracking record, normalized with vectorized string ops.
+
+        Returns:
+            DataFrame: One row per record with sender, raw_sender, sender_name and
+            sender_email stripped ('' when missing), plus sender_lower,
+            unstripped_lower (lowercased sender before stripping), is_email and
+            email_local (sender_lower before the '@')
+        """
+        columns = ['sender', 'raw_sender', 'sender_name', 'sender_email']
+        senders = pd.DataFrame.from_records(list(self.email_tracking.values()), columns=columns)
+        senders = senders.fillna('').astype(str)
+        unstripped = senders['sender']
+        for column in columns:
+            senders[column] = senders[column].str.strip()
+        senders['sender_lower'] = senders['sender'].str.lower()
+        senders['unstripped_lower'] = unstripped.str.lower()
+        senders['is_email'] = senders['sender'].str.contains('@', regex=False)
+        senders['email_local'] = senders['sender_lower'].str.split('@', n=1).str[0]
+        return senders
+
     def _initialize_contact_map(self):
         """Initialize the contact map from existing data to normalize contact identities without manual mapping."""
         logger.info("Initializing contact normalization map...")
@@ -238,200 +894,190 @@ class EmailAnalyzer:
             logger.info(f"Using existing contact map with {len(self.contact_map)} mappings")
             return
             
-        # Maps to store display name to email and email to display name relationships
-        email_to_names = defaultdict(set)
-        name_to_emails = defaultdict(set)
-        name_parts = {}  # Store first/last name parts
+        # Display name <-> email relationships, kept as an edge list over integer ids.
+        # Strings are interned once; edges are deduplicated and grouped with NumPy.
+        name_ids = {}   # display name -> id
+        email_ids = {}  # email -> id
+        edge_names = []
+        edge_emails = []
+        
+        def add_correspondence(name, email):
+            edge_names.append(name_ids.setdefault(name, len(name_ids)))
+            edge_emails.append(email_ids.setdefault(email, len(email_ids)))
+        
+        # Checked once; the per-pair debug calls below are skipped entirely when off
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         
         try:
+            # Normalize every record's sender fields once, vectorized; all passes reuse them as
+            # (sender, sender lowercased, unstripped sender lowercased, raw_sender, sender_name, sender_email)
+            senders = self._tracking_sender_frame()
+            sender_rows = list(zip(senders['sender'], senders['sender_lower'], senders['unstripped_lower'],
+                                   senders['raw_sender'], senders['sender_name'], senders['sender_email']))
+            
             # Step 0: First pass for raw sender preservation
             logger.debug("Step 0: Looking for raw_sender fields for initial mapping")
             raw_sender_pairs = []
             
-            for entry_id, data in self.email_tracking.items():
-                sender = data.get('sender', '').strip()
-                raw_sender = data.get('raw_sender', '').strip()
-                sender_name = data.get('sender_name', '').strip()
-                sender_email = data.get('sender_email', '').strip()
-                
+            for sender, sender_lower, _, raw_sender, sender_name, sender_email in sender_rows:
                 # If we have both raw_sender and sender fields, and they're different formats
                 if sender and raw_sender and sender != raw_sender:
                     if '@' in sender and '@' not in raw_sender:
                         # sender is email, raw_sender is display name
-                        email, display_name = sender.lower(), raw_sender.lower()
+                        email, display_name = sender_lower, raw_sender.lower()
                         raw_sender_pairs.append((display_name, email))
-                        logger.debug(f"  Found raw sender pair: '{display_name}' -> '{email}'")
+                        if debug_enabled:
+                            logger.debug("  Found raw sender pair: '%s' -> '%s'", display_name, email)
                     elif '@' in raw_sender and '@' not in sender:
                         # raw_sender is email, sender is display name
-                        email, display_name = raw_sender.lower(), sender.lower()
+                        email, display_name = raw_sender.lower(), sender_lower
                         raw_sender_pairs.append((display_name, email))
-                        logger.debug(f"  Found raw sender pair: '{display_name}' -> '{email}'")
+                        if debug_enabled:
+                            logger.debug("  Found raw sender pair: '%s' -> '%s'", display_name, email)
                 
                 # If we have explicit sender_name and sender_email fields (added in newer versions)
                 if sender_name and sender_email and '@' in sender_email:
                     email, display_name = sender_email.lower(), sender_name.lower()
                     raw_sender_pairs.append((display_name, email))
-                    logger.debug(f"  Found explicit name/email pair: '{display_name}' -> '{email}'")
-            
-            # Step 1: Build initial relationships from email tracking data
-            logger.debug("Step 1: Analyzing email data to extract name/email components")
-            for entry_id, data in self.email_tracking.items():
-                sender = data.get('sender', '').strip()
-                if not sender:
-                    continue
-                
-                # Skip system email addresses and likely non-human senders
-                if any(pattern in sender.lower() for pattern in ['noreply', 'no-reply', 'donotreply', 'system', 'notification', 'alert']):
-                    continue
-                    
-                if '@' in sender:  # It's an email address
-                    # Extract potential name parts from email (for later matching)
-                    email_local = sender.split('@')[0].lower()
-                    
-                    # Process email local part to find potential name components
-                    # e.g., "john.doe" -> "john" and "doe"
-                    name_parts_from_email = re.split(r'[._-]', email_local)
-                    if len(name_parts_from_email) > 1:
-                        for part in name_parts_from_email:
-                            if len(part) > 2:  # Avoid tiny fragments
-                                name_parts[part] = sender
-                                logger.debug(f"  Extracted name component '{part}' from email '{sender}'")
-                else:  # It's a display name
-                    # Store name words for potential matching
-                    name_words = [w.lower() for w in re.split(r'\W+', sender) if len(w) > 2]
-                    for word in name_words:
-                        name_parts[word] = sender
-                        logger.debug(f"  Extracted name component '{word}' from display name '{sender}'")
+                    if debug_enabled:
+                        logger.debug("  Found explicit name/email pair: '%s' -> '%s'", display_name, email)
             
             # Step 2: Find correspondences between names and emails in the data
             logger.debug("Step 2: Finding correspondences between names and emails")
             
             # First add the raw sender pairs
             for display_name, email in raw_sender_pairs:
-                email_to_names[email].add(display_name)
-                name_to_emails[display_name].add(email)
-                logger.debug(f"  Added correspondence from raw data: '{display_name}' <-> '{email}'")
+                add_correspondence(display_name, email)
+                if debug_enabled:
+                    logger.debug("  Added correspondence from raw data: '%s' <-> '%s'", display_name, email)
             
-            # Then find other correspondences through the email data
-            for entry_id, data in self.email_tracking.items():
-                sender = data.get('sender', '').strip()
-                if not sender:
-                    continue
-                    
-                if '@' in sender:  # It's an email
-                    email = sender.lower()
-                    # Look for display names in other messages from this sender
-                    for other_id, other_data in self.email_tracking.items():
-                        other_sender = other_data.get('sender', '').strip()
-                        if other_sender and '@' not in other_sender:
-                            # Check if email contains parts of the name or vice versa
-                            name_lower = other_sender.lower()
-                            name_words = [w for w in re.split(r'\W+', name_lower) if len(w) > 2]
-                            
-                            # Match if a substantial name part is in the email or vice versa
-                            email_local = email.split('@')[0]
-                            if (any(word in email_local for word in name_words) or
-                                any(part in name_lower for part in re.split(r'[._-]', email_local))):
-                                email_to_names[email].add(name_lower)
-                                name_to_emails[name_lower].add(email)
-                                logger.debug(f"  Found correspondence: '{other_sender}' <-> '{email}'")
-                else:  # It's a display name
-                    name = sender.lower()
-                    name_words = [w for w in re.split(r'\W+', name) if len(w) > 2]
-                    
-                    # Match with emails containing parts of this name
-                    for other_id, other_data in self.email_tracking.items():
-                        other_sender = other_data.get('sender', '').strip()
-                        if other_sender and '@' in other_sender:
-                            email = other_sender.lower()
-                            email_local = email.split('@')[0]
-                            
-                            # Match if a substantial name part is in the email or vice versa
-                            if (any(word in email_local for word in name_words) or
-                                any(part in name for part in re.split(r'[._-]', email_local))):
-                                email_to_names[email].add(name)
-                                name_to_emails[name].add(email)
-                                logger.debug(f"  Found correspondence: '{name}' <-> '{email}'")
+            # Then find other correspondences through the email data. Each distinct email
+            # and display name is decomposed once, and pairs are found through substring
+            # indexes instead of comparing every tracked sender with every other one.
+            present = senders[senders['sender'] != '']
+            distinct_emails = present[present['is_email']].drop_duplicates('sender_lower')
+            email_locals = dict(zip(distinct_emails['sender_lower'], distinct_emails['email_local']))  # email -> local part
+            email_parts = dict(zip(distinct_emails['sender_lower'],  # email -> local part split on . _ -
+                                   distinct_emails['email_local'].str.split(_EMAIL_SPLIT_RE.pattern, regex=True)))
+            name_words_by_name = {
+                name: [w for w in _WORD_RE.split(name) if len(w) > 2]
+                for name in present.loc[~present['is_email'], 'sender_lower'].unique()
+            }
             
-            # Add specific matching for names based on name components
-            for name in list(name_to_emails.keys()):
-                name_words = [w for w in re.split(r'\W+', name) if len(w) > 2]
-                
-                for email_data in self.email_tracking.values():
-                    sender = email_data.get('sender', '').lower()
-                    if '@' in sender and any(word in sender for word in name_words):
-                        # Strong match found
-                        email_to_names[sender].add(name)
-                        name_to_emails[name].add(sender)
-                        logger.debug(f"  Added correspondence using name components: '{name}' <-> '{sender}'")
+            # Intern in tracking order so ids (and tie-breaks in Step 3) don't depend on
+            # set iteration order below
+            for email in email_locals:
+                email_ids.setdefault(email, len(email_ids))
+            for name in name_words_by_name:
+                name_ids.setdefault(name, len(name_ids))
+            
+            # Match if a substantial name part is in the email or vice versa
+            emails_by_substring = _substring_index(
+                email_locals, {len(w) for words in name_words_by_name.values() for w in words})
+            names_by_substring = _substring_index(
+                {name: name for name in name_words_by_name},
+                {len(p) for parts in email_parts.values() for p in parts})
+            
+            for name, name_words in name_words_by_name.items():
+                for word in name_words:
+                    for email in emails_by_substring.get(word, ()):
+                        add_correspondence(name, email)
+                        if debug_enabled:
+                            logger.debug("  Found correspondence: '%s' <-> '%s'", name, email)
+            for email, parts in email_parts.items():
+                for part in parts:
+                    for name in names_by_substring.get(part, ()):
+                        add_correspondence(name, email)
+                        if debug_enabled:
+                            logger.debug("  Found correspondence: '%s' <-> '%s'", name, email)
+            
+            # Words of every display name seen so far (raw pairs included), split once
+            for name in name_ids:
+                if name not in name_words_by_name:
+                    name_words_by_name[name] = [w for w in _WORD_RE.split(name) if len(w) > 2]
+            
+            # Add specific matching for names based on name components: every tracked
+            # (unstripped) email sender containing one of the name's words, in tracking order
+            sender_positions = {}  # distinct email sender -> first position in tracking data
+            for _, _, sender, *_ in sender_rows:
+                if '@' in sender:
+                    sender_positions.setdefault(sender, len(sender_positions))
+            linked_name_ids = set(edge_names)
+            linked_names = [name for name, name_id in name_ids.items() if name_id in linked_name_ids]
+            senders_by_substring = _substring_index(
+                {sender: sender for sender in sender_positions},
+                {len(w) for name in linked_names for w in name_words_by_name[name]})
+            for name in linked_names:
+                matched = set()
+                for word in name_words_by_name[name]:
+                    matched.update(senders_by_substring.get(word, ()))
+                for sender in sorted(matched, key=sender_positions.__getitem__):
+                    # Strong match found
+                    add_correspondence(name, sender)
+                    if debug_enabled:
+                        logger.debug("  Added correspondence using name components: '%s' <-> '%s'", name, sender)
+            
+            # Deduplicate edges, sorted by name id then email id, and find each name's slice
+            edges = np.unique(np.array([edge_names, edge_emails], dtype=np.int64).reshape(2, -1), axis=1)
+            names = list(name_ids)    # id -> display name
+            emails = list(email_ids)  # id -> email
+            group_name_ids, group_starts = np.unique(edges[0], return_index=True)
+            group_ends = np.append(group_starts[1:], edges.shape[1])
             
             # Log found relationships for debugging
-            if logger.isEnabledFor(logging.DEBUG):
+            if debug_enabled:
                 logger.debug("Name to emails relationships:")
-                for name, emails in name_to_emails.items():
-                    logger.debug(f"  '{name}' -> {emails}")
+                for name_id, start, end in zip(group_name_ids, group_starts, group_ends):
+                    logger.debug("  '%s' -> %s", names[name_id], {emails[e] for e in edges[1, start:end]})
                     
                 logger.debug("Email to names relationships:")
-                for email, names in email_to_names.items():
-                    logger.debug(f"  '{email}' -> {names}")
+                by_email = np.argsort(edges[1], kind='stable')
+                email_group_ids, email_starts = np.unique(edges[1, by_email], return_index=True)
+                email_ends = np.append(email_starts[1:], edges.shape[1])
+                for email_id, start, end in zip(email_group_ids, email_starts, email_ends):
+                    logger.debug("  '%s' -> %s", emails[email_id], {names[n] for n in edges[0, by_email[start:end]]})
             
             # Step 3: Resolve the best email address for each display name
             logger.debug("Step 3: Resolving best email for each display name")
-            for name, emails in name_to_emails.items():
-                if emails:
-                    # Prefer the email that matches the name pattern better
-                    best_email = None
-                    best_score = 0
-                    
-                    name_words = [w for w in re.split(r'\W+', name) if len(w) > 2]
+            # The compiled scorer can't log, so debug runs keep the Python one
+            use_jit = _score_candidates_jit is not None and not debug_enabled
+            if use_jit:
+                # Local parts packed in email id order, so candidate ids index them directly
+                packed_locals, local_offsets = _pack_strings([email.split('@')[0] for email in emails])
+            for name_id, start, end in zip(group_name_ids, group_starts, group_ends):
+                name = names[name_id]
+                candidate_ids = edges[1, start:end]
+                
+                # Prefer the email that matches the name pattern better
+                best_email = None
+                best_score = 0
+                
+                name_words = name_words_by_name[name]
+                
+                # Calculate match score based on name parts found in email
+                if use_jit:
+                    packed_words, word_offsets = _pack_strings(name_words)
+                    scores = _score_candidates_jit(
+                        _to_codepoints(name), packed_words, word_offsets,
+                        packed_locals, local_offsets, candidate_ids)
+                else:
+                    scores = [_score_name_email(name, name_words, emails[e].split('@')[0], debug_enabled)
+                              for e in candidate_ids]
+                
+                for email_id, score in zip(candidate_ids, scores):
+                    email = emails[email_id]
+                    if debug_enabled:
+                        logger.debug("  Score for '%s' -> '%s': %s", name, email, score)
                     
-                    for email in emails:
-                        email_local = email.split('@')[0]
-                        
-                        # Calculate match score based on name parts found in email
-                        score = 0
-                        
-                        # Check each word in name against email
-                        for word in name_words:
-                            if word in email_local:
-                                score += 2  # Direct match is strongest
-                                logger.debug(f"  Word '{word}' direct match in '{email_local}' +2 points")
-                            elif any(word in part for part in re.split(r'[._-]', email_local)):
-                                score += 1  # Partial match
-                                logger.debug(f"  Word '{word}' partial match in '{email_local}' +1 point")
+                    if score > best_score:
+                        best_score = score
+                        best_email = email
                         
-                        # Check each part of email against name
-                        for part in re.split(r'[._-]', email_local):
-                            if len(part) > 2 and part in name:
-                                score += 2  # Direct match
-                                logger.debug(f"  Email part '{part}' direct match in '{name}' +2 points")
-                            elif any(part in word for word in name_words):
-                                score += 1  # Partial match
-                                logger.debug(f"  Email part '{part}' partial match in '{name}' +1 point")
-                        
-                        # Names exactly matching email local parts get highest score
-                        # e.g., "john.doe@example.com" with "John Doe"
-                        if ''.join(name_words) == email_local.replace('.', '').replace('-', '').replace('_', ''):
-                            score += 5
-                            logger.debug(f"  Full name match pattern for '{name}' and '{email}' +5 points")
-                            
-                        # First initial + last name pattern (j.smith@example.com with "John Smith")
-                        if (len(name_words) > 1 and 
-                            email_local.startswith(name_words[0][0]) and 
-                            email_local[1:].startswith(name_words[-1])):
-                            score += 4
-                            logger.debug(f"  First initial + last name pattern for '{name}' and '{email}' +4 points")
-                        
-                        logger.debug(f"  Score for '{name}' -> '{email}': {score}")
-                        
-                        if score > best_score:
-                            best_score = score
-                            best_email = email
-                            
-                    # Lower the threshold to 1 to increase matches
-                    if best_email and best_score >= 1:
-                        self.contact_map[name] = best_email
-                        logger.debug(f"  MAPPED: '{name}' -> '{best_email}' (score: {best_score})")
+                # Lower the threshold to 1 to increase matches
+                if best_email and best_score >= 1:
+                    self.contact_map[name] = best_email
+                    if debug_enabled:
+                        logger.debug("  MAPPED: '%s' -> '%s' (score: %s)", name, best_email, best_score)
             
             # Step 4: Fast track for direct mappings from SenderName -> SenderEmailAddress
             direct_mappings_count = 0
@@ -441,24 +1087,94 @@ class EmailAnalyzer:
                     if display_name not in self.contact_map:
                         self.contact_map[display_name] = email
                         direct_mappings_count += 1
-                        logger.debug(f"  DIRECT MAPPING: '{display_name}' -> '{email}'")
+                        if debug_enabled:
+                            logger.debug("  DIRECT MAPPING: '%s' -> '%s'", display_name, email)
             
             if direct_mappings_count > 0:
                 logger.info(f"Added {direct_mappings_count} direct mappings from sender_name/sender_email fields")
                     
             logger.info(f"Contact normalization map initialized with {len(self.contact_map)} mappings")
             if self.contact_map:
-                logger.debug("Contact map entries:")
-                for name, email in self.contact_map.items():
-                    logger.debug(f"  '{name}' -> '{email}'")
+                if debug_enabled:
+                    logger.debug("Contact map entries:")
+                    for name, email in self.contact_map.items():
+                        logger.debug("  '%s' -> '%s'", name, email)
                     
                 # Save the newly built contact map
                 self._save_contact_map()
         except Exception as e:
             logger.error(f"Error initializing contact map: {e}")
-            if logger.isEnabledFor(logging.DEBUG):
+            if debug_enabled:
                 logger.debug("Traceback:", exc_info=True)
     
+    def _add_to_conversation_history(self, conversation_id, message):
+        """
+        Record a received message in its conversation's history, keeping it sorted by time.
+
+        Args:
+            conversation_id (str): Outlook ConversationID of the message.
+            message (dict): Message info with 'received_time', 'sender' and 'entry_id'.
+        """
+        received_time = message.get('received_time')
+        if not received_time:
+            return # Undated messages can never be matched as a reply parent
+        thread = self.conversation_history[conversation_id]
+        index = bisect.bisect_right(thread['times'], received_time)
+        thread['times'].insert(index, received_time)
+        thread['msgs'].insert(index, message)
+
+    def _find_reply_parent(self, conversation_id, sent_time):
+        """
+        Find the most recent message in a conversation received before sent_time.
+
+        Args:
+            conversation_id (str): Outlook ConversationID of the reply.
+            sent_time (datetime): When the reply was sent.
+
+        Returns:
+            dict or None: The preceding message, or None if there is none.
+        """
+        thread = self.conversation_history.get(conversation_id)
+        if not thread:
+            return None
+        index = bisect.bisect_left(thread['times'], sent_time) - 1
+        return thread['msgs'][index] if index >= 0 else None
+
+    def _load_conversation_history(self, max_items):
+        """
+        Fill conversation_history from the newest received inbox messages, so replies
+        found by analyze_sent_items can be matched to the message they answer.
+
+        Args:
+            max_items (int): Maximum number of inbox rows to read.
+        """
+        if not self.inbox:
+            logger.warning("Inbox folder not available, reply response times cannot be measured.")
+            return
+        self.conversation_history.clear()
+        try:
+            rows = [row for row, _ in iter_mail_table(self.inbox, HISTORY_ITEM_COLUMNS, limit=max_items,
+                                                      set_columns=True)]
+        except pywintypes.com_error as ce:
+            logger.error(f"COM Error reading Inbox for conversation history: {ce}")
+            return
+        except Exception as e:
+            logger.error(f"Error reading Inbox for conversation history: {e}")
+            return
+        # Rows are newest first; add them oldest first so each insert lands at the end
+        for row in reversed(rows):
+            conversation_id = row['ConversationID']
+            if not conversation_id:
+                continue
+            sender = self._get_sender_address(None, {'sender_name': row['SenderName'],
+                                                     'sender_email': row['SenderEmailAddress']})
+            self._add_to_conversation_history(conversation_id, {
+                'received_time': self._convert_to_naive_datetime(row['ReceivedTime']),
+                'sender': sender,
+                'entry_id': row['EntryID'],
+            })
+        logger.info(f"Loaded {len(rows)} inbox messages into {len(self.conversation_history)} conversation histories.")
+
     def _normalize_contact(self, contact):
         """
         Normalize a contact identifier to a consistent form.
@@ -472,49 +1188,78 @@ class EmailAnalyzer:
         """
         if not contact:
             return "unknown"
-            
-        contact_lower = contact.lower()
         
-        # If already an email address, return as is
-        if '@' in contact_lower:
-            return contact_lower
-            
-        # Check if we know this display name
-        if contact_lower in self.contact_map:
-            normalized = self.contact_map[contact_lower]
-            if logger.isEnabledFor(logging.DEBUG):
-                logger.debug(f"Normalized contact: '{contact}' -> '{normalized}'")
+        # Recipients and senders repeat heavily; each distinct value is normalized once
+        normalized = self._normalized_contacts.get(contact)
+        if normalized is not None:
             return normalized
-            
-        # No mapping found, return as is
-        return contact_lower
         
-    def _get_sender_address(self, item):
-        """Safely retrieve the sender's email address or name."""
-        sender_addr = safe_get_property(item, 'SenderEmailAddress')
+        # Already-lowercase email addresses (the common case) are returned without
+        # building a new string; interning makes later dict lookups on them cheaper
+        if contact.find('@') >= 0:
+            normalized = sys.intern(contact if contact.islower() else contact.lower())
+        else:
+            contact_lower = contact.lower()
+            # Known display names map to their email address (one dict probe);
+            # no mapping found, return as is
+            normalized = self.contact_map.get(contact_lower, contact_lower)
+        
+        self._normalized_contacts[contact] = normalized
+        return normalized
+        
+    def _get_sender_address(self, item, properties=None):
+        """
+        Safely retrieve the sender's email address or name.
+
+        Args:
+            item: Outlook mail item
+            properties (dict, optional): Already-read sender_email/sender_name values
+                (e.g. from a Table row), used instead of reading the item again.
+        """
+        if properties is not None:
+            sender_addr = properties['sender_email']
+            get_sender_name = lambda: properties['sender_name']
+        else:
+            sender_addr = safe_get_property(item, 'SenderEmailAddress')
+            get_sender_name = lambda: safe_get_property(item, 'SenderName')
         # Check for Exchange addresses (no '@')
         if sender_addr and '@' not in sender_addr and sender_addr.startswith('/'):
+            cache = self._exchange_address_cache
+            if sender_addr in cache:
+                cache.move_to_end(sender_addr)
+                smtp_address = cache[sender_addr]
+                if smtp_address:
+                    return smtp_address
+                sender_name = get_sender_name()
+                return sender_name if sender_name else "Unknown Sender"
             try:
                 # Attempt to resolve Exchange address
+                smtp_address = None
                 sender_entry = self.namespace.CreateRecipient(sender_addr)
                 sender_entry.Resolve()
                 if sender_entry.Resolved:
                     exchange_user = sender_entry.AddressEntry.GetExchangeUser()
                     if exchange_user:
-                        return exchange_user.PrimarySmtpAddress
+                        smtp_address = exchange_user.PrimarySmtpAddress
+                # Remember the outcome (including "unresolvable"); COM errors below aren't cached
+                cache[sender_addr] = smtp_address
+                if len(cache) > EXCHANGE_ADDRESS_CACHE_SIZE:
+                    cache.popitem(last=False)
+                if smtp_address:
+                    return smtp_address
                 # Fallback if resolution fails
-                sender_name = safe_get_property(item, 'SenderName')
+                sender_name = get_sender_name()
                 return sender_name if sender_name else "Unknown Sender"
             except Exception as e:
                 logger.debug(f"Error resolving Exchange sender address {sender_addr}: {e}")
                 # Fallback to name if Exchange resolution fails
-                sender_name = safe_get_property(item, 'SenderName')
+                sender_name = get_sender_name()
                 return sender_name if sender_name else "Unknown Sender"
         elif sender_addr and '@' in sender_addr:
              return sender_addr # Use SMTP address if available
         else:
              # Fallback to SenderName if address is invalid or missing
-             sender_name = safe_get_property(item, 'SenderName')
+             sender_name = get_sender_name()
              return sender_name if sender_name else "Unknown Sender"
 
     def run_all_analyses(self, max_items_per_folder=None):
@@ -578,134 +1323,153 @@ class EmailAnalyzer:
         logger.info("Analyzing sent items to identify response patterns AND initiations...")
         max_items = max_items or self.config.get('max_analysis_emails', 5000)
         sent_folder = self.sent_items
+        logger.info(f"Processing up to {max_items} items from Sent Items.")
 
-        try:
-            sent_items_collection = sent_folder.Items
-            sent_items_collection.Sort("[ReceivedTime]", True) # Sort by received time, descending
-            total_items = sent_items_collection.Count
-        except pywintypes.com_error as ce:
-            logger.error(f"COM Error accessing Sent Items: {ce}")
-            return None
-        except Exception as e:
-            logger.error(f"Error accessing Sent Items: {e}")
-            return None
-
-        num_to_process = min(total_items, max_items)
-        logger.info(f"Processing up to {num_to_process} items from Sent Items.")
+        # Recipients and body length of items opened by earlier runs, by EntryID. Every run
+        # still reads and scores the newest max_items rows (the same window as a full scan);
+        # only opening items already read before is skipped (see _save_sent_items_cache)
+        incremental = self.config.get('sent_items_incremental', True)
+        sent_cache = self._load_sent_items_cache() if incremental else {}
+        new_sent_cache = {}
+        scan_complete = True
 
         # Data structures for this analysis run
         response_data = defaultdict(list) # For replies to incoming emails
         sender_initiations = defaultdict(lambda: {'count': 0, 'dates': []}) # For emails sent TO contacts
-        conversation_threads = defaultdict(list) # For general conversation analysis
+        # Per-thread summary for general conversation analysis; individual messages aren't kept
+        conversation_threads = defaultdict(lambda: {
+            'count': 0,
+            'first_sent': None,
+            'last_sent': None,
+            'recipients': set(),
+            'total_body_length': 0
+        })
 
-        processed_count = 0
-        for i in range(num_to_process):
-            item = None # Initialize for finally block
-            try:
-                item = sent_items_collection.Item(i + 1)
+        # Received messages that replies found below are matched against
+        self._load_conversation_history(max_items)
 
-                if not hasattr(item, 'Class') or item.Class != 43: continue # olMail
+        # Subject/SentOn/ConversationID come back in bulk from the folder's Table
+        sent_rows = [] # (row, item details or None if still to be read, naive sent time)
+        try:
+            for row, item in iter_mail_table(sent_folder, SENT_ITEM_COLUMNS, limit=max_items, sort_by="SentOn"):
+                sent_on_time_naive = self._convert_to_naive_datetime(row['SentOn'])
+                # Skip if critical info is missing
+                if not sent_on_time_naive: continue
+                details = sent_cache.get(row['EntryID'])
+                if details is None and item is not None: # Items walk fallback: read the item we already hold
+                    try:
+                        details = _sent_item_details(item)
+                    except Exception as e:
+                        logger.debug(f"Error reading sent item '{row.get('Subject')}': {e}")
+                        continue
+                    finally:
+                        del item # Explicitly release item COM object
+                sent_rows.append((row, details, sent_on_time_naive))
+        except pywintypes.com_error as ce:
+            logger.error(f"COM Error reading Sent Items: {ce}")
+            scan_complete = False
+        except Exception as e:
+            logger.error(f"Error reading Sent Items: {e}")
+            scan_complete = False
 
-                # --- Get Essential Info ---
-                recipients_to = [] # Primary recipients (To field)
-                all_recipients = [] # All recipients (To, CC, BCC)
+        # Recipients and Body need the item itself. Table rows are opened by EntryID on
+        # worker threads, each with its own COM apartment and MAPI session, so the
+        # Outlook round trips overlap; results are consumed here in folder order.
+        workers = max(1, self.config.get('sent_items_workers', 4))
+        processed_count = 0
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        with _ComThreadPool(workers) as executor:
+            for row, details, sent_on_time_naive in _iter_sent_item_details(
+                    executor, sent_rows, workers * SENT_ITEM_READS_PER_WORKER):
                 try:
-                    for recipient in item.Recipients:
-                        # olTo = 1, olCC = 2, olBCC = 3
-                        recipient_type = getattr(recipient, 'Type', 1)
-                        # Normalize address - prefer Address if available, else Name
-                        address = getattr(recipient, 'Address', None)
-                        name = getattr(recipient, 'Name', 'Unknown')
-                        raw_recipient = address if address and '@' in address else name
+                    if details is None:
+                        continue # Not cached, so the next run tries to open it again
+                    new_sent_cache[row['EntryID']] = details
+                    raw_recipients, body_len = details
+
+                    # --- Get Essential Info ---
+                    recipients_to = [] # Primary recipients (To field)
+                    all_recipients = [] # All recipients (To, CC, BCC)
+                    for recipient_type, raw_recipient in raw_recipients:
                         normalized_recipient = self._normalize_contact(raw_recipient)
-                        
                         all_recipients.append(normalized_recipient)
                         if recipient_type == 1: # Only track 'To' recipients for initiation score
                             recipients_to.append(normalized_recipient)
 
-                except pywintypes.com_error as r_ce:
-                    logger.debug(f"COM Error accessing recipients for item {i+1}: {r_ce}")
-
-                conversation_id = getattr(item, 'ConversationID', None)
-                sent_on_time = getattr(item, 'SentOn', None)
-                subject = getattr(item, 'Subject', '')
-                body_len = len(getattr(item, 'Body', ''))
-                sent_on_time_naive = self._convert_to_naive_datetime(sent_on_time)
-                
-                # Skip if critical info is missing
-                if not sent_on_time_naive: continue
-
-                # --- Track Initiations --- 
-                if not subject.lower().startswith("re:") and not subject.lower().startswith("fw:"): # Not a reply/forward
-                    for recipient in recipients_to: # Score based on To: field
-                        sender_initiations[recipient]['count'] += 1
-                        sender_initiations[recipient]['dates'].append(sent_on_time_naive)
-
-                # --- Process REPLIES using Conversation History (Existing Logic) --- 
-                if subject.lower().startswith("re:") and conversation_id:
-                    # Find the message being replied to in the conversation history
-                    thread_history = self.conversation_history.get(conversation_id)
-                    parent_message = None
-                    if thread_history:
-                        for msg_in_thread in reversed(thread_history):
-                            msg_received_time = msg_in_thread.get('received_time')
-                            if msg_received_time and msg_received_time < sent_on_time_naive:
-                                parent_message = msg_in_thread
-                                break # Found the most recent preceding message
-                                
-                    if parent_message:
-                        parent_received = parent_message.get('received_time')
-                        parent_sender = parent_message.get('sender', "Unknown Sender")
-                        # Normalize the parent sender
-                        parent_sender = self._normalize_contact(parent_sender)
-                        # parent_entry_id = parent_message.get('entry_id') # Not currently used
+                    conversation_id = row['ConversationID']
+                    subject = row['Subject'] or ''
+
+                    subject_lower = subject.lower()
+                    is_reply = subject_lower.startswith("re:")
+
+                    # --- Track Initiations --- 
+                    if not subject_lower.startswith(REPLY_FORWARD_PREFIXES): # Not a reply/forward
+                        for recipient in recipients_to: # Score based on To: field
+                            sender_initiations[recipient]['count'] += 1
+                            sender_initiations[recipient]['dates'].append(sent_on_time_naive)
+
+                    # --- Process REPLIES using Conversation History (Existing Logic) --- 
+                    if is_reply and conversation_id:
+                        # Find the message being replied to in the conversation history
+                        parent_message = self._find_reply_parent(conversation_id, sent_on_time_naive)
+
+                        if parent_message:
+                            parent_received = parent_message.get('received_time')
+                            parent_sender = parent_message.get('sender', "Unknown Sender")
+                            # Normalize the parent sender
+                            parent_sender = self._normalize_contact(parent_sender)
+                            # parent_entry_id = parent_message.get('entry_id') # Not currently used
                         
-                        logger.debug(f"Reply '{subject}' matched to parent email from '{parent_sender}' received at {parent_received}")
-                        try:
-                            if isinstance(parent_received, datetime.datetime):
-                                response_time_td = sent_on_time_naive - parent_received
-                                response_time_hours = response_time_td.total_seconds() / 3600
+                            logger.debug(f"Reply '{subject}' matched to parent email from '{parent_sender}' received at {parent_received}")
+                            try:
+                                if isinstance(parent_received, datetime.datetime):
+                                    response_time_td = sent_on_time_naive - parent_received
+                                    response_time_hours = response_time_td.total_seconds() / 3600
                                 
-                                response_data[parent_sender].append({
-                                    'response_time': response_time_hours,
-                                    'response_length': body_len,
-                                    'subject': subject,
-                                    'sent_date': sent_on_time_naive 
-                                })
-                            else:
-                                logger.debug(f"Skipping response time calc due to invalid parent time type: {type(parent_received)}")
-                        except (TypeError, OverflowError) as dt_err:
-                            logger.debug(f"Time calculation error for reply {subject}: {dt_err}")
-                    else:
-                        logger.debug(f"Could not find preceding message in history for reply: {subject} (ConvID: {conversation_id})")
-
-                # --- Store sent item details for conversation threading analysis (remains the same) ---
-                if conversation_id: # Track all sent items in threads
-                    conversation_threads[conversation_id].append({
-                        'sent_time': sent_on_time_naive,
-                        'recipients': all_recipients, # Use all recipients here
-                        'subject': subject,
-                        'body_length': body_len
-                    })
+                                    response_data[parent_sender].append({
+                                        'response_time': response_time_hours,
+                                        'response_length': body_len,
+                                        'subject': subject,
+                                        'sent_date': sent_on_time_naive 
+                                    })
+                                else:
+                                    logger.debug(f"Skipping response time calc due to invalid parent time type: {type(parent_received)}")
+                            except (TypeError, OverflowError) as dt_err:
+                                logger.debug(f"Time calculation error for reply {subject}: {dt_err}")
+                        else:
+                            logger.debug(f"Could not find preceding message in history for reply: {subject} (ConvID: {conversation_id})")
+
+                    # --- Summarize sent items per conversation thread ---
+                    if conversation_id: # Track all sent items in threads
+                        thread = conversation_threads[conversation_id]
+                        thread['count'] += 1
+                        if thread['first_sent'] is None or sent_on_time_naive < thread['first_sent']:
+                            thread['first_sent'] = sent_on_time_naive
+                        if thread['last_sent'] is None or sent_on_time_naive > thread['last_sent']:
+                            thread['last_sent'] = sent_on_time_naive
+                        thread['recipients'].update(all_recipients) # Use all recipients here
+                        thread['total_body_length'] += body_len
 
-                processed_count += 1
-                if processed_count % 500 == 0:
-                    logger.info(f"Processed {processed_count}/{num_to_process} sent items...")
+                    processed_count += 1
+                    if processed_count % 500 == 0:
+                        logger.info(f"Processed {processed_count} sent items...")
 
-            except pywintypes.com_error as ce:
-                logger.debug(f"COM error processing sent item index {i+1}: {ce}")
-            except Exception as e:
-                logger.debug(f"General error processing sent item index {i+1}: {e}", exc_info=True)
-            finally:
-                # Explicitly release item COM object
-                if item is not None:
-                    del item
-                    item = None
+                except pywintypes.com_error as ce:
+                    logger.debug(f"COM error processing sent item '{row.get('Subject')}': {ce}")
+                except Exception as e:
+                    if debug_enabled: # Only capture the traceback when it will be emitted
+                        logger.debug("General error processing sent item '%s': %s", row.get('Subject'), e, exc_info=True)
 
         logger.info(f"Completed initial scan of {processed_count} sent items.")
         # Pass the new initiations data to the calculation function
         self._calculate_contact_importance(response_data, conversation_threads, dict(sender_initiations))
         self._save_sender_scores()
+        if incremental:
+            if not scan_complete:
+                # Rows past the failure weren't reached; keep what earlier runs read for them
+                new_sent_cache = {**sent_cache, **new_sent_cache}
+            # Otherwise only items in this run's window are kept, so the cache stays bounded
+            self._save_sent_items_cache(new_sent_cache)
 
         # Return the collected data (optional)
         return {
@@ -714,6 +1478,26 @@ class EmailAnalyzer:
             'sender_initiations': dict(sender_initiations)
         }
 
+    def _load_sent_items_cache(self):
+        """ Load the sent item details (recipients, body length) saved by the last analyze_sent_items run. """
+        cache_file = self.data_dir / 'sent_items_cache.pkl'
+        if not cache_file.exists():
+            return {}
+        try:
+            return _load_pickle(cache_file)
+        except Exception as e:
+            logger.warning(f"Could not load sent items cache '{cache_file}': {e}. Opening all sent items.")
+            return {}
+
+    def _save_sent_items_cache(self, sent_cache):
+        """ Saves the sent item details, keyed by EntryID, for the next run. """
+        cache_file = self.data_dir / 'sent_items_cache.pkl'
+        try:
+            _save_pickle(cache_file, sent_cache, compress=True)
+            logger.debug(f"Saved sent items cache for {len(sent_cache)} items to {cache_file}")
+        except Exception as e:
+            logger.error(f"Failed to save sent items cache to {cache_file}: {e}")
+
     def _calculate_contact_importance(self, response_data, conversation_threads, sender_initiations):
         """
         Calculate sender importance scores based on multiple interaction types:
@@ -732,6 +1516,9 @@ class EmailAnalyzer:
         initiation_factor = self.config.get('initiation_score_factor', 0.5)
         read_kept_factor = self.config.get('read_kept_score_factor', 0.3)
         min_emails_reply = self.config.get('min_emails_for_pattern', 1) # Min emails for reply analysis component
+        reply_time_weight = self.config.get('reply_time_weight', 0.4)
+        reply_rate_weight = self.config.get('reply_rate_weight', 0.4)
+        reply_length_weight = self.config.get('reply_length_weight', 0.2)
         # min_total_interactions = self.config.get('min_interactions_for_score', 2) # Optional: Threshold for total interactions
         
         # --- Combine all known senders/contacts --- 
@@ -740,21 +1527,23 @@ class EmailAnalyzer:
         # Normalize all contacts in the combined set
         normalized_contacts = set(self._normalize_contact(contact) for contact in all_contacts)
         
+        # Display names mapping to each email, built once instead of scanning the map per contact
+        display_names_by_email = defaultdict(list)
+        for display_name, email in self.contact_map.items():
+            display_names_by_email[email].append(display_name)
+        
         new_sender_scores = {}
         raw_scores = [] # To collect raw scores for normalization
+        updated_time = datetime.datetime.now() # Shared by every score in this run
         
         # --- Calculate raw score for each contact --- 
         for normalized_contact in normalized_contacts:
             raw_score = 0
-            last_interaction_date = None
-            interaction_dates = []
+            latest_dates = [] # Latest date from each interaction source
             
-            # For each normalized contact, find all possible identities
-            possible_identities = [normalized_contact]
-            # Add any display names that map to this email
-            for display_name, email in self.contact_map.items():
-                if email == normalized_contact:
-                    possible_identities.append(display_name)
+            # For each normalized contact, find all possible identities:
+            # itself plus any display names that map to this email
+            possible_identities = [normalized_contact, *display_names_by_email.get(normalized_contact, ())]
             
             # 1. Contribution from Reply Patterns 
             reply_component_score = 0
@@ -770,54 +1559,58 @@ class EmailAnalyzer:
                 valid_responses = [r for r in all_responses if r.get('response_time') is not None and r['response_time'] >= 0]
                 if valid_responses:
                     reply_count = len(valid_responses)
-                    avg_response_time = np.mean([r['response_time'] for r in valid_responses])
-                    avg_response_length = np.mean([r['response_length'] for r in valid_responses])
-                    response_dates = [r['sent_date'] for r in valid_responses if r.get('sent_date')]
-                    interaction_dates.extend(response_dates)
+                    # One pass for both averages and the date range; the lists are short,
+                    # so plain Python beats building arrays for np.mean
+                    response_time_sum = 0.0
+                    response_length_sum = 0
+                    min_date = max_date = None
+                    for r in valid_responses:
+                        response_time_sum += r['response_time']
+                        response_length_sum += r['response_length']
+                        sent_date = r.get('sent_date')
+                        if sent_date:
+                            if min_date is None or sent_date < min_date:
+                                min_date = sent_date
+                            if max_date is None or sent_date > max_date:
+                                max_date = sent_date
+                    avg_response_time = response_time_sum / reply_count
+                    avg_response_length = response_length_sum / reply_count
+                    latest_dates.append(max_date)
                     
                     response_time_score = 1.0 / (1.0 + max(0, avg_response_time) / 24.0)
-                    min_date, max_date = min(response_dates), max(response_dates)
                     date_range_days = max(1, (max_date - min_date).days)
                     response_freq = reply_count / date_range_days
 
                     reply_component_score = (
-                        self.config.get('reply_time_weight', 0.4) * response_time_score +
-                        self.config.get('reply_rate_weight', 0.4) * min(1.0, response_freq * 10) +
-                        self.config.get('reply_length_weight', 0.2) * min(1.0, max(0, avg_response_length) / 500)
+                        reply_time_weight * response_time_score +
+                        reply_rate_weight * min(1.0, response_freq * 10) +
+                        reply_length_weight * min(1.0, max(0, avg_response_length) / 500)
                     )
             raw_score += reply_component_score * reply_factor # Add weighted reply component
 
             # 2. Contribution from Initiations (Sent TO)
             initiation_count = 0
-            initiation_dates = []
             for identity in possible_identities:
                 if identity in sender_initiations:
                     initiation_data = sender_initiations[identity]
                     initiation_count += initiation_data['count']
-                    initiation_dates.extend(initiation_data['dates'])
+                    latest_dates.append(_latest_datetime(initiation_data['dates']))
             
             raw_score += initiation_count * initiation_factor
-            interaction_dates.extend(initiation_dates)
             
             # 3. Contribution from Read & Kept (Received FROM)
             read_kept_count = 0
-            read_kept_dates = []
             for identity in possible_identities:
                 if identity in sender_read_kept_stats:
                     read_kept_data = sender_read_kept_stats[identity]
                     read_kept_count += read_kept_data['count']
                     if 'dates' in read_kept_data:
-                        read_kept_dates.extend(read_kept_data['dates'])
+                        latest_dates.append(_latest_datetime(read_kept_data['dates']))
             
             raw_score += read_kept_count * read_kept_factor
-            interaction_dates.extend(read_kept_dates)
             
-            # Find the latest interaction date across all types
-            if interaction_dates:
-                # Filter out any non-datetime objects that might have slipped in
-                valid_dates = [d for d in interaction_dates if isinstance(d, datetime.datetime)]
-                if valid_dates:
-                    last_interaction_date = max(valid_dates)
+            # Latest interaction date across all types, from each source's own latest date
+            last_interaction_date = _latest_datetime(latest_dates)
                 
             # --- Debug Log --- 
             total_interactions = reply_count + initiation_count + read_kept_count
@@ -834,80 +1627,77 @@ class EmailAnalyzer:
                     'last_interaction': last_interaction_date, # Store the latest date
                     'normalized_score': 0.5, # Default normalized score
                     # Back-compat: some downstream diagnostics expect 'score'.
-                    # We will populate it after normalization to maintain compatibility.
-                    'score': 0.0,
-                    'last_updated': datetime.datetime.now()
+                    # Kept equal to normalized_score (updated with it below).
+                    'score': 0.5,
+                    'last_updated': updated_time
                 }
                 raw_scores.append(raw_score)
 
         # --- Normalize Scores --- 
         if new_sender_scores and raw_scores:
-            max_raw_score = max(raw_scores) if raw_scores else 0
-            min_raw_score = min(raw_scores) if raw_scores else 0
-            raw_score_range = max_raw_score - min_raw_score
+            # raw_scores is aligned with new_sender_scores (both filled in the same order)
+            raw = np.asarray(raw_scores, dtype=np.float64)
+            min_raw_score = raw.min()
+            raw_score_range = raw.max() - min_raw_score
 
             if raw_score_range > 0:
-                for contact, data in new_sender_scores.items():
-                    norm_score = (data['raw_score'] - min_raw_score) / raw_score_range
-                    # Apply a gentle sigmoid-like curve to spread scores more towards ends? Optional.
-                    # norm_score = 1 / (1 + np.exp(- (norm_score - 0.5) * 5)) # Example sigmoid scaling
-                    data['normalized_score'] = max(0.0, min(1.0, norm_score))
-                    data['score'] = data['normalized_score']  # Alias
+                norm_scores = np.clip((raw - min_raw_score) / raw_score_range, 0.0, 1.0)
+                # Apply a gentle sigmoid-like curve to spread scores more towards ends? Optional.
+                # norm_scores = 1 / (1 + np.exp(- (norm_scores - 0.5) * 5)) # Example sigmoid scaling
+                for data, norm_score in zip(new_sender_scores.values(), norm_scores.tolist()):
+                    data['normalized_score'] = norm_score
+                    data['score'] = norm_score  # Alias
             elif len(new_sender_scores) == 1: # Only one sender with a score
                  # Give the single sender a moderate score if range is zero
                  single_sender = list(new_sender_scores.keys())[0]
                  new_sender_scores[single_sender]['normalized_score'] = 0.6 # Or some other default
-
-        # Ensure 'score' present for each sender and refresh timestamp
-        for sender, data in new_sender_scores.items():
-            data['score'] = data.get('normalized_score', 0.0)
-            data['last_updated'] = datetime.datetime.now()
+                 new_sender_scores[single_sender]['score'] = 0.6  # Alias
 
         self.sender_scores = new_sender_scores # Update the instance attribute
         logger.info(f"Calculated importance scores for {len(self.sender_scores)} contacts based on combined factors.")
 
     def _save_sender_scores(self):
-        """ Saves the current sender scores to a pickle file, with guaranteed serializable types. """
+        """
+        Saves the current sender scores, with guaranteed serializable types: as Parquet
+        (one row per sender) when pyarrow is installed, otherwise, or with the
+        'sender_scores_use_pickle' setting, as a pickle file.
+        """
         scores_file = self.data_dir / 'sender_scores.pkl'
         try:
-            # Create a sanitized copy with guaranteed picklable types
+            # Create a sanitized copy with guaranteed serializable types
             sanitized_scores = {}
             
             for sender, data in self.sender_scores.items():
-                clean_data = {}
-                for key, value in data.items():
-                    # Clean last_interaction timestamp if present
-                    if key == 'last_interaction' and value is not None:
-                        if hasattr(value, 'strftime'):
-                            try:
-                                # Format to string then parse back to ensure standard datetime
-                                dt_str = value.strftime('%Y-%m-%d %H:%M:%S')
-                                clean_data[key] = datetime.datetime.strptime(dt_str, '%Y-%m-%d %H:%M:%S')
-                            except Exception as dt_err:
-                                logger.warning(f"Sanitization error for {key} in sender {sender}: {dt_err}. Setting to None.")
-                                clean_data[key] = None
-                        else:
-                            logger.warning(f"Non-datetime value for {key} in sender {sender}: {type(value)}. Setting to None.")
-                            clean_data[key] = None
+                clean_data = dict(data)
+                # Clean last_interaction timestamp if present
+                value = clean_data.get('last_interaction')
+                if value is not None:
+                    if isinstance(value, datetime.datetime):
+                        clean_data['last_interaction'] = value.replace(tzinfo=None)
                     else:
-                        # Copy other values directly
-                        clean_data[key] = value
-                        
+                        logger.warning(f"Non-datetime value for last_interaction in sender {sender}: {type(value)}. Setting to None.")
+                        clean_data['last_interaction'] = None
                 sanitized_scores[sender] = clean_data
                 
-            with open(scores_file, 'wb') as f:
-                pickle.dump(sanitized_scores, f)
+            if pyarrow is not None and not self.config.get('sender_scores_use_pickle', False):
+                scores_file = scores_file.with_suffix('.parquet')
+                _save_parquet_records(scores_file, sanitized_scores)
+            else:
+                _save_pickle(scores_file, sanitized_scores)
             logger.info(f"Saved sender scores to {scores_file}")
         except Exception as e:
             logger.error(f"Failed to save sender scores to {scores_file}: {e}")
 
     # ---------------- Inbox Behavior Analysis ----------------
     def _save_contact_map(self):
-        """Save the contact normalization map to a pickle file."""
+        """Save the contact normalization map as JSON (pickle without orjson)."""
         contact_map_file = self.data_dir / 'contact_map.pkl'
         try:
-            with open(contact_map_file, 'wb') as f:
-                pickle.dump(self.contact_map, f)
+            if orjson is not None:
+                contact_map_file = contact_map_file.with_suffix('.json')
+                _save_json(contact_map_file, self.contact_map)
+            else:
+                _save_pickle(contact_map_file, self.contact_map, compress=True)
             logger.info(f"Saved contact map to {contact_map_file} with {len(self.contact_map)} mappings")
         except Exception as e:
             logger.error(f"Error saving contact map to {contact_map_file}: {e}")
@@ -919,15 +1709,9 @@ class EmailAnalyzer:
             logger.warning("Inbox folder not available, skipping inbox behavior analysis.")
             return False
 
-        try:
-            # Ensure items are sorted by received time, newest first
-            items = self.inbox.Items
-            items.Sort("[ReceivedTime]", True)
-        except Exception as e:
-            logger.warning(f"Could not sort inbox items: {e}. Proceeding without sorting.")
-            items = self.inbox.Items
-
         processed_count = 0
+        # Every item scanned here is in the Inbox, so it can only count as read/unread kept;
+        # 'deleted' and 'moved' stay in the schema but cannot be observed from this scan.
         sender_behavior = defaultdict(lambda: {
             'read_kept': 0, 
             'unread_kept': 0, 
@@ -935,106 +1719,142 @@ class EmailAnalyzer:
             'moved': 0, 
             'total': 0
         })
+        # Items come from self.inbox, so their parent folder is the inbox for all of them
+        inbox_path = safe_get_property(self.inbox, 'FolderPath')
 
-        # Map for direct sender-to-display-name associations
-        name_email_pairs = []
+        # Direct display-name -> email associations, one entry per name (the last seen wins,
+        # as it would when applied to contact_map in scan order)
+        name_email_pairs = {}
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
-        num_items_to_process = min(items.Count, max_items) if max_items else items.Count
+        total_items = self.inbox.Items.Count
+        num_items_to_process = min(total_items, max_items) if max_items else total_items
         logger.info(f"Processing up to {num_items_to_process} items from Inbox.")
 
-        for i in range(num_items_to_process):
+        # Every property the scan needs comes back from the inbox Table, newest first, in
+        # one enumeration (Items.SetColumns caches the same columns if there is no Table)
+        inbox_rows = []
+        try:
+            for row, _ in iter_mail_table(self.inbox, INBOX_ITEM_COLUMNS, limit=num_items_to_process,
+                                          set_columns=True):
+                inbox_rows.append(row)
+        except pywintypes.com_error as ce:
+            logger.error(f"COM Error reading Inbox: {ce}")
+        except Exception as e:
+            logger.error(f"Error reading Inbox: {e}")
+
+        # Previous tracking records for the rows just read, in a few IN (...) queries
+        # instead of one per item
+        previous_tracking = self.email_tracking.get_many(row['EntryID'] for row in inbox_rows)
+
+        # One timestamp for the whole scan, so every record updated in this run shares it
+        checked_time = datetime.datetime.now(timezone.utc)
+        unchanged_entry_ids = [] # Records whose content matches the previous run
+        # Tracking upserts are committed together by _save_email_tracking
+        self.email_tracking.begin()
+        for i, row in enumerate(inbox_rows):
             try:
-                item = items[i + 1]  # 1-based index for Outlook collections
-                if item.Class == 43:  # olMail
-                    entry_id = safe_get_property(item, 'EntryID')
-                    
-                    # --- Load previous tracking state for this email --- 
-                    previous_tracking_data = self.email_tracking.get(entry_id, {})
-                    previous_check_count = previous_tracking_data.get('check_count', 0)
-                    # Determine if it was unread *last* time we checked
-                    # If 'is_currently_read' was False last time, then it was unread.
-                    # Default to True (read) if key is missing, meaning it wasn't unread last time.
-                    was_unread_last_run = not previous_tracking_data.get('is_currently_read', True)
-
-                    # Try to get both display name and email address for contact normalization
-                    sender_name = safe_get_property(item, 'SenderName')
-                    sender_email = safe_get_property(item, 'SenderEmailAddress')
+                entry_id = row['EntryID']
                     
-                    # Capture direct name-email mappings as we process emails
-                    if sender_name and sender_email and '@' in sender_email:
-                        name_email_pairs.append((sender_name.lower(), sender_email.lower()))
+                # --- Load previous tracking state for this email --- 
+                previous_tracking_data = previous_tracking.get(entry_id, {})
+                previous_check_count = previous_tracking_data.get('check_count', 0)
+                # Determine if it was unread *last* time we checked
+                # If 'is_currently_read' was False last time, then it was unread.
+                # Default to True (read) if key is missing, meaning it wasn't unread last time.
+                was_unread_last_run = not previous_tracking_data.get('is_currently_read', True)
+
+                # Try to get both display name and email address for contact normalization
+                sender_name = row['SenderName']
+                sender_email = row['SenderEmailAddress']
+                
+                # Capture direct name-email mappings as we process emails
+                if sender_name and sender_email and '@' in sender_email:
+                    name_email_pairs[sender_name.lower()] = sender_email.lower()
+                    if debug_enabled:
                         logger.debug(f"Captured direct name-email pair: '{sender_name}' -> '{sender_email}'")
-                    
-                    # Use our regular get_sender_address method
-                    raw_sender = self._get_sender_address(item)
-                    sender = self._normalize_contact(raw_sender)  # Normalize the contact
-                    
-                    if not sender or not entry_id:
-                        continue
-
-                    current_folder = safe_get_property(item, 'Parent.FolderPath')
-                    is_read = safe_get_property(item, 'UnRead') == False
-                    received_time = self._convert_to_naive_datetime(safe_get_property(item, 'ReceivedTime'))
-                    last_modified = self._convert_to_naive_datetime(safe_get_property(item, 'LastModificationTime'))
-
-                    # --- Calculate new check_count based on current read status --- 
-                    if not is_read: # Currently unread
-                        new_check_count = previous_check_count + 1
-                    else: # Currently read
-                        new_check_count = 0 # Reset the counter
+                
+                # Use our regular get_sender_address method
+                raw_sender = self._get_sender_address(None, {'sender_name': sender_name,
+                                                             'sender_email': sender_email})
+                sender = self._normalize_contact(raw_sender)  # Normalize the contact
+                
+                if not sender or not entry_id:
+                    continue
 
+                is_read = row['UnRead'] == False
+                received_time = self._convert_to_naive_datetime(row['ReceivedTime'])
+                last_modified = self._convert_to_naive_datetime(row['LastModificationTime'])
+                # The tracking store keeps whole seconds; drop the milliseconds MAPI times carry
+                # so records read back from it compare equal to unchanged items
+                if received_time:
+                    received_time = received_time.replace(microsecond=0)
+                if last_modified:
+                    last_modified = last_modified.replace(microsecond=0)
+
+                # --- Calculate new check_count based on current read status --- 
+                if not is_read: # Currently unread
+                    new_check_count = previous_check_count + 1
+                else: # Currently read
+                    new_check_count = 0 # Reset the counter
+
+                if debug_enabled:
                     logger.debug(f"  Tracking update for {entry_id}: was_unread_last={was_unread_last_run}, is_read_now={is_read}, prev_count={previous_check_count}, new_count={new_check_count}")
 
-                    # Update tracking data
-                    self.email_tracking[entry_id] = {
-                        'subject': safe_get_property(item, 'Subject', default="<No Subject>"),
-                        'sender': sender,  # Store normalized sender
-                        'raw_sender': raw_sender,  # Keep the original sender for reference
-                        'sender_name': sender_name,  # Store actual Outlook fields for reference
-                        'sender_email': sender_email,
-                        'received_time': received_time, # Already converted
-                        'last_modified': last_modified, # Already converted
-                        'folder_path': current_folder,
-                        'is_currently_read': is_read, # Store the *current* read status for the *next* run
-                        'check_count': new_check_count, # Store the updated count
-                        'last_checked': datetime.datetime.now(timezone.utc) # Use datetime.datetime.now()
-                    }
+                # Update tracking data
+                tracking_record = {
+                    'subject': row['Subject'] or '',
+                    'sender': sender,  # Store normalized sender
+                    'raw_sender': raw_sender,  # Keep the original sender for reference
+                    'sender_name': sender_name,  # Store actual Outlook fields for reference
+                    'sender_email': sender_email,
+                    'received_time': received_time, # Already converted
+                    'last_modified': last_modified, # Already converted
+                    'folder_path': inbox_path,
+                    'is_currently_read': is_read, # Store the *current* read status for the *next* run
+                    'check_count': new_check_count, # Store the updated count
+                    'last_checked': checked_time
+                }
+                # Unchanged since the last run: only last_checked needs writing
+                if previous_tracking_data and all(previous_tracking_data.get(key) == value
+                                                  for key, value in tracking_record.items()
+                                                  if key != 'last_checked'):
+                    unchanged_entry_ids.append(entry_id)
+                else:
+                    self.email_tracking[entry_id] = tracking_record
 
-                    # Basic behavior analysis (can be refined)
-                    sb = sender_behavior[sender]  # Use normalized sender
-                    sb['total'] += 1
-                    if current_folder == self.inbox.FolderPath: # Still in Inbox
-                        if is_read:
-                            sb['read_kept'] += 1
-                        else:
-                            sb['unread_kept'] += 1
-                    elif safe_get_property(item, 'Parent.Name') == 'Deleted Items':
-                         sb['deleted'] += 1
-                    else: # Moved to another folder
-                         sb['moved'] += 1
+                # Basic behavior analysis (can be refined)
+                sb = sender_behavior[sender]  # Use normalized sender
+                sb['total'] += 1
+                if is_read:
+                    sb['read_kept'] += 1
+                else:
+                    sb['unread_kept'] += 1
 
-                    processed_count += 1
+                processed_count += 1
 
             except Exception as e:
-                subject_preview = safe_get_property(item, 'Subject', default="<Unknown>")[:50]
+                subject_preview = (row.get('Subject') or "<Unknown>")[:50]
                 logger.error(f"Error processing inbox item {i+1} ('{subject_preview}...'): {e}", exc_info=False)
                 # Optional: log full traceback in debug mode
-                if logger.isEnabledFor(logging.DEBUG):
-                    logger.debug(f"Traceback for error processing item {i+1}:", exc_info=True)
+                if debug_enabled:
+                    logger.debug("Traceback for error processing item %d:", i + 1, exc_info=True)
 
             if max_items and processed_count >= max_items:
                 logger.info(f"Reached processing limit of {max_items} inbox items.")
                 break
 
-        logger.info(f"Completed initial scan of {processed_count} inbox items.")
+        self.email_tracking.touch(unchanged_entry_ids, checked_time)
+        logger.info(f"Completed initial scan of {processed_count} inbox items ({len(unchanged_entry_ids)} unchanged).")
         
         # Update contact_map with direct sender-display pairs
         if name_email_pairs:
             direct_mappings = 0
-            for name, email in name_email_pairs:
+            for name, email in name_email_pairs.items():
                 if name and email and '@' in email:
                     self.contact_map[name] = email
                     direct_mappings += 1
+            self._normalized_contacts.clear() # Display names may now resolve differently
             
             if direct_mappings > 0:
                 logger.info(f"Added {direct_mappings} direct name->email mappings to contact map")
@@ -1057,53 +1877,23 @@ class EmailAnalyzer:
         return True
 
     def _save_email_tracking(self):
-        """ Saves the current email tracking data to a pickle file, with guaranteed serializable types. """
-        tracking_file = self.data_dir / 'email_tracking.pkl'
+        """ Commits the tracking records written since the last save. Only changed rows are written. """
         try:
-            # Create a sanitized copy for safety before pickling
-            sanitized_tracking = {}
-            
-            for entry_id, record in self.email_tracking.items():
-                # Create a clean record with simple, picklable types
-                clean_record = {}
-                for key, value in record.items():
-                    # Special handling for datetime fields
-                    # Include new fields in sanitization
-                    if key in ['received_time', 'last_modified', 'last_checked', 'first_opened_time', 'sent_on_time'] and value is not None:
-                        # Convert any datetime-like object to string then back to datetime for absolute safety
-                        if hasattr(value, 'strftime'):
-                            try:
-                                # Format to string then parse back to ensure standard datetime
-                                dt_str = value.strftime('%Y-%m-%d %H:%M:%S')
-                                clean_record[key] = datetime.datetime.strptime(dt_str, '%Y-%m-%d %H:%M:%S')
-                            except Exception as dt_err:
-                                logger.warning(f"Sanitization error for {key} in {entry_id}: {dt_err}. Setting to None.")
-                                clean_record[key] = None
-                        else:
-                            logger.warning(f"Non-datetime value for {key} in {entry_id}: {type(value)}. Setting to None.")
-                            clean_record[key] = None
-                    else:
-                        # Copy other values directly
-                        clean_record[key] = value
-                
-                sanitized_tracking[entry_id] = clean_record
-
-            # Pickle using the sanitized copy
-            with open(tracking_file, 'wb') as f:
-                pickle.dump(sanitized_tracking, f)
-            logger.info(f"Saved email tracking data to {tracking_file}")
-        
+            self.email_tracking.commit()
+            logger.info(f"Saved email tracking data to {self.email_tracking.db_path}")
         except Exception as e:
-            logger.error(f"Failed to save email tracking data to {tracking_file}: {e}")
+            logger.error(f"Failed to save email tracking data to {self.email_tracking.db_path}: {e}")
 
     def _save_inbox_behavior(self):
-        """ Saves the current inbox behavior patterns to a pickle file. """
+        """ Saves the current inbox behavior patterns as JSON (pickle without orjson). """
         behavior_file = self.data_dir / 'inbox_behavior.pkl'
         try:
-            # Ensure nested defaultdicts are converted for pickling if necessary
             # For sender_read_kept_stats, we already converted to dict() when storing
-            with open(behavior_file, 'wb') as f:
-                pickle.dump(self.email_patterns, f) # Save the whole patterns dict
+            if orjson is not None:
+                behavior_file = behavior_file.with_suffix('.json')
+                _save_json(behavior_file, self.email_patterns) # Save the whole patterns dict
+            else:
+                _save_pickle(behavior_file, self.email_patterns, compress=True)
             logger.info(f"Saved inbox behavior data to {behavior_file}")
         except Exception as e:
              logger.error(f"Failed to save inbox behavior data to {behavior_file}: {e}")
@@ -1121,21 +1911,41 @@ class EmailAnalyzer:
 
         logger.info("Analyzing folder structure...")
         folder_data = {}
+        # Counts and stats from the last run by folder EntryID; folders whose item and
+        # unread counts haven't changed reuse their stats instead of being sampled again
+        folder_cache = self._load_folder_cache()
+        new_folder_cache = {}
+        analyze_read_stats = self.config.get('analyze_read_stats', True)
+
+        # Counts and content sample for one folder (subfolders are filled in by assemble_folder_info)
+        def analyze_folder_contents(parent_folder, folder_name, folder_path, parent_path, entry_id=None):
+            folder_info = {
+                'name': folder_name,
+                'path': folder_path,
+                'item_count': 0,
+                'unread_count': 0,
+                'subfolders': [],
+                'stats': {}
+            }
 
-        # Use a local import for re if only used here, or ensure it's imported at the top
-        import re # Needed for cleaning subject in stats
-
-        # Recursive helper function
-        def process_folders_recursive(parent_folder, parent_path=""):
+            # Get unread count safely: the folder keeps it, no need to filter its items
             try:
-                folder_name = getattr(parent_folder, 'Name', 'ErrorGettingName')
-                # Skip problematic system folders explicitly by name
-                # Add other known system/problematic folder names if necessary
-                if folder_name in ['Conversation Action Settings', 'Quick Step Settings', 'RSS Feeds', 'Sync Issues', 'Conflicts', 'Local Failures', 'Server Failures']:
-                     logger.debug(f"Skipping system/problematic folder: {folder_name}")
-                     return None
+                folder_info['unread_count'] = parent_folder.UnReadItemCount
+            except Exception as e_uc:
+                logger.debug(f"UnReadItemCount unavailable for '{folder_path}', counting with Restrict: {e_uc}")
+                try:
+                    filter_unread = "[Unread]=True"
+                    unread_items = parent_folder.Items.Restrict(filter_unread)
+                    folder_info['unread_count'] = unread_items.Count
+                except Exception as e_uc:
+                    logger.debug(f"Error getting unread count for '{folder_path}': {e_uc}")
 
-                folder_path = f"{parent_path}/{folder_name}" if parent_path else folder_name
+            # Items.Count forces a full enumeration on large PST/IMAP folders; folders
+            # without unread mail skip it (and their stats) unless read stats are wanted
+            if not folder_info['unread_count'] and not analyze_read_stats:
+                return folder_info
+
+            try:
                 item_count = parent_folder.Items.Count # This can be slow/error-prone
             except pywintypes.com_error as ce:
                 # Log the parent path where the error occurred
@@ -1144,98 +1954,76 @@ class EmailAnalyzer:
             except Exception as e:
                 logger.error(f"Error accessing basic folder info under '{parent_path}': {e}. Skipping.")
                 return None
+            folder_info['item_count'] = item_count
 
-            folder_info = {
-                'name': folder_name,
-                'path': folder_path,
-                'item_count': item_count,
-                'unread_count': 0,
-                'subfolders': [],
-                'stats': {}
-            }
-
-            # Get unread count safely
-            try:
-                filter_unread = "[Unread]=True"
-                unread_items = parent_folder.Items.Restrict(filter_unread)
-                folder_info['unread_count'] = unread_items.Count
-            except Exception as e_uc:
-                logger.debug(f"Error getting unread count for '{folder_path}': {e_uc}")
+            cached = folder_cache.get(entry_id) if entry_id else None
+            if (cached and cached['item_count'] == item_count
+                    and cached['unread_count'] == folder_info['unread_count']):
+                folder_info['stats'] = cached['stats']
+                return folder_info
 
             # Analyze contents (simplified sample)
             if item_count > 0:
                 try:
-                    items = parent_folder.Items
-                    sender_counts = Counter()
-                    topic_counts = Counter()
-                    date_counts = Counter()
+                    # Keys are collected per row and counted in one Counter pass each afterwards
+                    senders = []
+                    topics = []
+                    months = [] # (year, month); formatted once per month below
                     read_status = {'read': 0, 'unread': 0}
                     sample_size = min(item_count, 50) # Smaller sample for speed
 
-                    # Sorting might be slow/error-prone, consider removing or sampling differently
-                    try:
-                         items.Sort("[ReceivedTime]", True)
-                    except Exception as sort_err:
-                         logger.debug(f"Could not sort items in folder '{folder_path}'. Proceeding without sorting. Error: {sort_err}")
-
-
-                    for i in range(sample_size):
+                    # Newest first, read in bulk through the folder's Table (or its Items with
+                    # only these columns cached, if no Table is available)
+                    # Without a Table, large folders are read from the end rather than fully sorted
+                    sample_rows = iter_mail_table(parent_folder, FOLDER_SAMPLE_COLUMNS, limit=sample_size,
+                                                  restriction=MAIL_ITEMS_FILTER, set_columns=True,
+                                                  sort_items=item_count <= FOLDER_SORT_LIMIT)
+                    for i, (row, _) in enumerate(sample_rows, 1):
                         try:
-                            # Access item by index (1-based) - needs error handling
-                            if (i + 1) > items.Count: break # Stop if index goes out of bounds
-                            item = items.Item(i + 1)
-
-                            if not hasattr(item, 'Class') or item.Class != 43: continue
-
                             # Get Sender Safely
                             sender = "Unknown Sender"
-                            try:
-                                sender_addr = getattr(item, 'SenderEmailAddress', None)
-                                sender_name = getattr(item, 'SenderName', None)
-                                if sender_addr and '@' in sender_addr: sender = sender_addr
-                                elif sender_name: sender = sender_name
-                            except pywintypes.com_error:
-                                sender = getattr(item, 'SenderName', "Unknown Sender")
-                            except Exception: pass
-                            sender_counts[sender] += 1
+                            sender_addr = row['SenderEmailAddress']
+                            sender_name = row['SenderName']
+                            if sender_addr and '@' in sender_addr: sender = sender_addr
+                            elif sender_name: sender = sender_name
+                            senders.append(sender)
 
                             # Get Date Safely
-                            rec_time = getattr(item, 'ReceivedTime', None)
+                            rec_time = row['ReceivedTime']
                             if rec_time:
                                 try:
                                      if isinstance(rec_time, (datetime.datetime, pywintypes.TimeType)):
-                                         month_year = rec_time.strftime("%Y-%m")
-                                         date_counts[month_year] += 1
+                                         months.append((rec_time.year, rec_time.month))
                                 except (AttributeError, OverflowError, ValueError) as fmt_err:
                                      logger.debug(f"Error formatting date {rec_time}: {fmt_err}")
 
-                            # Get Read Status Safely
-                            is_unread = getattr(item, 'Unread', True)
+                            # Get Read Status Safely (unknown counts as unread)
+                            is_unread = row['UnRead'] is not False
                             read_status['read' if not is_unread else 'unread'] += 1
 
                             # Get Subject Safely
-                            subject = getattr(item, 'Subject', '')
+                            subject = row['Subject'] or ''
                             if subject:
                                 try:
-                                     clean_subject = re.sub(r'^(RE|FWD|FW):\s*', '', subject, flags=re.IGNORECASE).strip()
+                                     if subject[:4].lower().startswith(REPLY_FORWARD_PREFIXES):
+                                         subject = _RE_PREFIX.sub('', subject, count=1)
+                                     clean_subject = subject.strip()
                                      if clean_subject: # Avoid counting empty subjects as topics
-                                          topic_counts[clean_subject] += 1
+                                          topics.append(clean_subject)
                                 except Exception as subj_e:
                                      logger.debug(f"Error cleaning subject '{subject}': {subj_e}")
 
-
-                        except pywintypes.com_error as item_ce:
-                             logger.debug(f"COM error accessing item {i+1} in '{folder_path}': {item_ce}")
-                        except IndexError:
-                             logger.warning(f"Index error accessing item {i+1} in '{folder_path}'. Collection may have changed.")
-                             break # Stop sampling this folder
                         except Exception as item_e:
-                            logger.debug(f"Error analyzing item {i+1} in '{folder_path}': {item_e}")
+                            logger.debug(f"Error analyzing item {i} in '{folder_path}': {item_e}")
 
+                    sender_counts = Counter(senders)
+                    topic_counts = Counter(topics)
+                    date_counts = Counter(months)
                     folder_info['stats'] = {
                         'top_senders': dict(sender_counts.most_common(5)),
                         'top_topics': dict(topic_counts.most_common(5)),
-                        'date_distribution': dict(sorted(date_counts.items(), reverse=True)),
+                        'date_distribution': {f"{year:04d}-{month:02d}": count for (year, month), count
+                                              in sorted(date_counts.items(), reverse=True)},
                         'read_status': read_status
                     }
                 except pywintypes.com_error as items_ce:
@@ -1243,6 +2031,62 @@ class EmailAnalyzer:
                 except Exception as items_e:
                     logger.debug(f"Error accessing/analyzing items in '{folder_path}': {items_e}")
 
+            return folder_info
+
+        def analyze_folder_by_id(entry_id, store_id, folder_name, folder_path, parent_path):
+            """Worker thread: reopen the folder in this thread's MAPI session and analyze it."""
+            folder = _com_thread.namespace.GetFolderFromID(entry_id, store_id)
+            return analyze_folder_contents(folder, folder_name, folder_path, parent_path, entry_id)
+
+        # Walks the tree on this thread, queueing each folder's contents analysis on the
+        # worker pool. Returns a (get folder_info, [child nodes], EntryID) node, or None if
+        # skipped. Depth and folder count are capped so huge archive trees stay bounded.
+        max_depth = self.config.get('folder_max_depth', 8)
+        max_folders = self.config.get('folder_max_folders', 500)
+        folders_queued = 0
+
+        def process_folders_recursive(parent_folder, parent_path="", depth=0):
+            nonlocal folders_queued
+            if depth > max_depth:
+                logger.debug(f"Not descending below '{parent_path}': folder_max_depth ({max_depth}) reached")
+                return None
+            if folders_queued >= max_folders:
+                if folders_queued == max_folders:
+                    logger.warning(f"folder_max_folders ({max_folders}) reached; remaining folders are not analyzed.")
+                    folders_queued += 1 # Warn only once
+                return None
+            try:
+                folder_name = getattr(parent_folder, 'Name', 'ErrorGettingName')
+                # Skip problematic system folders explicitly by name
+                if folder_name in _SKIP_FOLDER_NAMES:
+                     logger.debug(f"Skipping system/problematic folder: {folder_name}")
+                     return None
+                # Calendar, Contacts, Tasks etc. (and their subfolders) hold no mail to analyze
+                if getattr(parent_folder, 'DefaultItemType', OL_MAIL_ITEM) != OL_MAIL_ITEM:
+                     logger.debug(f"Skipping non-mail folder: {folder_name}")
+                     return None
+
+                folder_path = f"{parent_path}/{folder_name}" if parent_path else folder_name
+            except Exception as e:
+                logger.error(f"Error accessing basic folder info under '{parent_path}': {e}. Skipping.")
+                return None
+            folders_queued += 1
+
+            # COM objects can't cross threads: workers reopen the folder by its IDs
+            try:
+                folder_ids = (parent_folder.EntryID, parent_folder.StoreID)
+            except Exception as e_id:
+                logger.debug(f"Could not get IDs of '{folder_path}', analyzing it on this thread: {e_id}")
+                folder_ids = None
+            if executor is not None and folder_ids:
+                get_folder_info = executor.submit(analyze_folder_by_id, *folder_ids,
+                                                  folder_name, folder_path, parent_path).result
+            else:
+                folder_info = analyze_folder_contents(parent_folder, folder_name, folder_path, parent_path,
+                                                      folder_ids[0] if folder_ids else None)
+                get_folder_info = lambda: folder_info
+            subfolder_nodes = []
+
             # Process subfolders
             try:
                 subfolders_collection = parent_folder.Folders
@@ -1253,9 +2097,9 @@ class EmailAnalyzer:
                         try:
                             subfolder_obj = subfolders_collection.Item(i)
                             # Recursive call
-                            subfolder_info = process_folders_recursive(subfolder_obj, folder_path)
-                            if subfolder_info: # Append only if successfully processed
-                                folder_info['subfolders'].append(subfolder_info)
+                            subfolder_node = process_folders_recursive(subfolder_obj, folder_path, depth + 1)
+                            if subfolder_node: # Append only if not skipped
+                                subfolder_nodes.append(subfolder_node)
                         except pywintypes.com_error as ce_sf:
                             sf_name = f"subfolder index {i}"
                             try: sf_name = getattr(subfolder_obj, 'Name', sf_name) # Try to get name for logging
@@ -1271,6 +2115,28 @@ class EmailAnalyzer:
             except Exception as sf_e:
                 logger.debug(f"Error accessing subfolders collection of '{folder_path}': {sf_e}")
 
+            return get_folder_info, subfolder_nodes, folder_ids[0] if folder_ids else None
+
+        # Collects the analyzed folder_info of a node and its subfolders, in tree order
+        def assemble_folder_info(node):
+            get_folder_info, subfolder_nodes, entry_id = node
+            try:
+                folder_info = get_folder_info()
+            except Exception as e:
+                logger.error(f"Error analyzing folder: {e}. Skipping.")
+                return None
+            if folder_info is None:
+                return None # Basic info failed: skip the folder and everything under it
+            if entry_id:
+                new_folder_cache[entry_id] = {
+                    'item_count': folder_info['item_count'],
+                    'unread_count': folder_info['unread_count'],
+                    'stats': folder_info['stats']
+                }
+            for subfolder_node in subfolder_nodes:
+                subfolder_info = assemble_folder_info(subfolder_node)
+                if subfolder_info: # Append only if successfully processed
+                    folder_info['subfolders'].append(subfolder_info)
             return folder_info
 
         # --- Start Processing ---
@@ -1295,24 +2161,57 @@ class EmailAnalyzer:
             logger.error("Could not determine any root folders to start structure analysis.")
             return None
 
-        # Process identified roots
+        # Process identified roots. Folder contents are analyzed by worker threads, each
+        # with its own COM apartment and MAPI session, while this thread walks the tree.
         processed_structures = {}
-        for key, folder_obj in root_folders_to_process:
-             logger.info(f"Processing folder structure starting from: {getattr(folder_obj, 'Name', 'N/A')} ({key})")
-             structure = process_folders_recursive(folder_obj)
-             if structure:
-                 processed_structures[key] = structure # Store under the root key
+        workers = self.config.get('folder_analysis_workers', 4)
+        executor = _ComThreadPool(workers) if workers > 1 else None
+        try:
+            for key, folder_obj in root_folders_to_process:
+                 logger.info(f"Processing folder structure starting from: {getattr(folder_obj, 'Name', 'N/A')} ({key})")
+                 node = process_folders_recursive(folder_obj)
+                 structure = assemble_folder_info(node) if node else None
+                 if structure:
+                     processed_structures[key] = structure # Store under the root key
+        finally:
+            if executor is not None:
+                executor.shutdown()
 
         self.folder_structure = processed_structures # Update the main structure
+        # Only folders seen in this run are kept, so deleted folders drop out of the cache
+        self._save_folder_cache(new_folder_cache)
         logger.info(f"Folder structure analysis complete.")
         return self.folder_structure # Return the structure just analyzed
 
+    def _load_folder_cache(self):
+        """ Load the per-folder counts and stats saved by the last folder structure analysis. """
+        cache_file = self.data_dir / 'folder_cache.pkl'
+        if not cache_file.exists():
+            return {}
+        try:
+            return _load_pickle(cache_file)
+        except Exception as e:
+            logger.warning(f"Could not load folder cache '{cache_file}': {e}. Sampling all folders.")
+            return {}
+
+    def _save_folder_cache(self, folder_cache):
+        """ Saves the per-folder counts and stats, keyed by folder EntryID. """
+        cache_file = self.data_dir / 'folder_cache.pkl'
+        try:
+            _save_pickle(cache_file, folder_cache, compress=True)
+            logger.debug(f"Saved folder cache for {len(folder_cache)} folders to {cache_file}")
+        except Exception as e:
+            logger.error(f"Failed to save folder cache to {cache_file}: {e}")
+
     def _save_folder_structure(self):
-        """ Saves the current folder structure to a pickle file. """
+        """ Saves the current folder structure as JSON (pickle without orjson or with folder_structure_use_pickle). """
         structure_file = self.data_dir / 'folder_structure.pkl'
         try:
-            with open(structure_file, 'wb') as f:
-                pickle.dump(self.folder_structure, f)
+            if orjson is not None and not self.config.get('folder_structure_use_pickle', False):
+                structure_file = structure_file.with_suffix('.json')
+                _save_json(structure_file, self.folder_structure)
+            else:
+                _save_pickle(structure_file, self.folder_structure, buffering=PICKLE_WRITE_BUFFER)
             logger.info(f"Saved folder structure to {structure_file}")
         except Exception as e:
             logger.error(f"Failed to save folder structure to {structure_file}: {e}") 
\ No newline at end of file
@@ -1,6 +1,9 @@
+import copy
 import json
 import logging
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +19,14 @@ DEFAULT_CONFIG = {
     'response_rate_weight': 0.4,
     'response_length_weight': 0.2,
     'max_analysis_emails': 5000,  # Max emails to analyze per folder
+    'sent_items_workers': 4,  # Threads opening sent items in parallel during analysis
+    'folder_analysis_workers': 4,  # Threads analyzing folder contents in parallel (1 = no threads)
+    'folder_max_depth': 8,  # Deepest subfolder level analyzed (the store root is level 0)
+    'folder_max_folders': 500,  # Max folders analyzed per folder structure analysis
+    'sender_scores_use_pickle': False,  # Save sender scores as pickle even when Parquet (pyarrow) is available
+    'analyze_read_stats': True,  # Count and sample folders without unread mail; False skips their slow Items.Count
+    'folder_structure_use_pickle': False,  # Save the folder structure as pickle even when orjson is available
+    'sent_items_incremental': True,  # Reuse recipients/body sizes of sent items opened by earlier runs; False reopens every item
     'min_emails_for_pattern': 5,  # Min emails needed to establish a pattern
     'days_for_temporal_analysis': 90,  # Analyze last 90 days for temporal patterns
     
@@ -30,6 +41,7 @@ DEFAULT_CONFIG = {
     'nlp_extract_topics_count': 5,       # Number of topics to extract in fallback mode
     'nlp_detect_action_items': True,     # Enable rule-based action item detection 
     'nlp_use_keyword_boost': True,       # Boost scores based on keyword matching
+    'nlp_workers': 4,                    # Processes analyzing email content in parallel in fallback mode (1 = in-process)
     
     # Message state factors
     'unread_bonus': 0.1,            # Bonus for unread emails
@@ -66,6 +78,65 @@ DEFAULT_CONFIG = {
     },
 }
 
+def _freeze(value):
+    """Wrap a dict, and the dicts nested in it, in read-only MappingProxyType views."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    return value
+
+# Read-only, so no caller can change the defaults seen by later load_config calls
+DEFAULT_CONFIG = _freeze(DEFAULT_CONFIG)
+
+def _copy_config(value):
+    """Deep copy a config value into plain, mutable dicts (deepcopy can't copy MappingProxyType)."""
+    if isinstance(value, Mapping):
+        return {key: _copy_config(item) for key, item in value.items()}
+    return copy.deepcopy(value)
+
+# Parsed user config files: resolved path -> (st_mtime_ns, parsed JSON)
+_user_config_cache = {}
+
+def _read_user_config(config_file):
+    """
+    Parse a JSON config file, reusing the last parse while the file's mtime is unchanged.
+
+    Args:
+        config_file (Path): Path to the configuration file.
+
+    Returns:
+        dict: A fresh copy of the parsed JSON, safe for the caller to modify.
+    """
+    key = config_file.resolve()
+    mtime = config_file.stat().st_mtime_ns
+    cached = _user_config_cache.get(key)
+    if cached is None or cached[0] != mtime:
+        with open(config_file, 'r') as f:
+            cached = (mtime, json.load(f))
+        _user_config_cache[key] = cached
+    return copy.deepcopy(cached[1])
+
+def _deep_merge(base, override):
+    """
+    Merge override into base, recursing into nested dicts so that keys the override
+    doesn't mention keep their base values.
+
+    Nested dicts from base are copied before being merged into, so dicts shared
+    with DEFAULT_CONFIG are never modified.
+
+    Args:
+        base (dict): Dict to merge into (modified in place).
+        override (dict): Values to apply on top of base.
+
+    Returns:
+        dict: base, for convenience.
+    """
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(base.get(key), dict):
+            base[key] = _deep_merge(dict(base[key]), value)
+        else:
+            base[key] = value
+    return base
+
 def load_config(config_path='./config.json'):
     """
     Load configuration from a JSON file, merging with defaults.
@@ -77,21 +148,15 @@ def load_config(config_path='./config.json'):
         dict: The loaded and merged configuration.
     """
     config_file = Path(config_path)
-    config = DEFAULT_CONFIG.copy() # Start with defaults
+    config = _copy_config(DEFAULT_CONFIG) # Start with a private copy of the defaults
 
     if config_file.exists():
         try:
-            with open(config_file, 'r') as f:
-                user_config = json.load(f)
-
-            # Deep merge user config onto defaults (simple merge for top level, llm_config)
-            config.update(user_config)
-            if 'llm_config' in user_config:
-                # Ensure llm_config exists in defaults before updating
-                if 'llm_config' in config:
-                     config['llm_config'].update(user_config['llm_config'])
-                else:
-                     config['llm_config'] = user_config['llm_config'] # If default didn't have it
+            user_config = _read_user_config(config_file)
+
+            # Deep merge user config onto defaults, so partial nested sections
+            # (e.g. llm_config.copilot_proxy) keep the defaults they don't override
+            _deep_merge(config, user_config)
 
             logger.info(f"Loaded configuration from {config_file}")
 
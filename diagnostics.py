@@ -31,6 +31,9 @@ except ImportError:
     print("pip install pandas numpy tabulate")
     sys.exit(1)
 
+from tracking_store import open_email_tracking
+from analyzer import _sender_scores_file, _load_sender_scores_file
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -637,11 +640,29 @@ def main():
         
         # 2. Load data files
         data_dir = args.data_dir
-        sender_scores_path = os.path.join(data_dir, 'sender_scores.pkl')
-        email_tracking_path = os.path.join(data_dir, 'email_tracking.pkl')
+        email_tracking_path = os.path.join(data_dir, 'email_tracking.db')
         
-        sender_scores = load_pickle_file(sender_scores_path) or {}
-        email_tracking = load_pickle_file(email_tracking_path) or {}
+        # Same file the analyzer reads: Parquet unless pyarrow is missing or
+        # sender_scores_use_pickle is set, so a stale file never wins
+        sender_scores_path = _sender_scores_file(data_dir, config)
+        if sender_scores_path.suffix == '.parquet':
+            try:
+                sender_scores = _load_sender_scores_file(sender_scores_path)
+                logger.info(f"Loaded data from {sender_scores_path}")
+            except Exception as e:
+                logger.error(f"Error loading parquet file {sender_scores_path}: {str(e)}")
+                sender_scores = {}
+        else:
+            sender_scores = load_pickle_file(str(sender_scores_path)) or {}
+        tracking_store = open_email_tracking(data_dir)
+        if tracking_store is not None:
+            email_tracking = dict(tracking_store.items())
+            tracking_store.close()
+            logger.info(f"Loaded data from {email_tracking_path}")
+        else:
+            # Data saved before the SQLite tracking store
+            email_tracking_path = os.path.join(data_dir, 'email_tracking.pkl')
+            email_tracking = load_pickle_file(email_tracking_path) or {}
         
         # 3. Load latest recommendation report
         latest_report = find_latest_report(args.reports_dir)
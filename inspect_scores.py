@@ -3,26 +3,28 @@ import pprint
 from pathlib import Path
 import logging
 
+from config import load_config
+from analyzer import _sender_scores_file, _load_sender_scores_file
+
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 # Define the path to the sender scores file
 DATA_DIR = Path("./email_data")
-SCORES_FILE = DATA_DIR / "sender_scores.pkl"
 
 def inspect_scores():
-    """Loads and prints the contents of the sender_scores.pkl file."""
-    if not SCORES_FILE.exists():
-        logger.error(f"Sender scores file not found: {SCORES_FILE}")
-        print(f"\nError: File not found at {SCORES_FILE}")
+    """Loads and prints the sender scores file the analyzer would read (Parquet or pickle)."""
+    # Picked the way EmailAnalyzer picks it (pyarrow, sender_scores_use_pickle, file present)
+    scores_file = _sender_scores_file(DATA_DIR, load_config())
+    if not scores_file.exists():
+        logger.error(f"Sender scores file not found: {scores_file}")
+        print(f"\nError: File not found at {scores_file}")
         return
 
     try:
-        with open(SCORES_FILE, 'rb') as f:
-            sender_scores = pickle.load(f)
-        
-        logger.info(f"Successfully loaded {len(sender_scores)} sender records from {SCORES_FILE}")
+        sender_scores = _load_sender_scores_file(scores_file)
+        logger.info(f"Successfully loaded {len(sender_scores)} sender records from {scores_file}")
         
         print("\n--- Sender Scores Data ---")
         if sender_scores:
@@ -31,10 +33,10 @@ def inspect_scores():
             print("The sender scores file is empty.")
             
     except (EOFError, pickle.UnpicklingError) as p_err:
-        logger.error(f"Error unpickling {SCORES_FILE}: {p_err}")
+        logger.error(f"Error unpickling {scores_file}: {p_err}")
         print(f"\nError: Could not read the pickle file. It might be corrupted or empty.")
     except Exception as e:
-        logger.error(f"An unexpected error occurred while reading {SCORES_FILE}: {e}", exc_info=True)
+        logger.error(f"An unexpected error occurred while reading {scores_file}: {e}", exc_info=True)
         print(f"\nAn unexpected error occurred: {e}")
 
 if __name__ == "__main__":
@@ -181,6 +181,9 @@ def main():
     
     # Initialize analyzer
     analyzer = EmailAnalyzer(namespace, inbox, sent_items, config, data_dir)
+    if args.command in ("organize", "report"):
+        # Read the saved data these commands score with in parallel, up front
+        analyzer.load_analysis_data(('sender_scores', 'email_patterns', 'email_tracking'))
     
     # Process command
     if args.command == "analyze":
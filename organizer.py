@@ -13,10 +13,58 @@ from pathlib import Path
 import pandas as pd
 
 from scorer import score_email, recommend_action
-from outlook_utils import get_or_create_folder, create_task_from_email
+from content_processor import read_email_fields, process_emails_content
+from outlook_utils import get_or_create_folder, create_task_from_email, iter_items
 
 logger = logging.getLogger(__name__)
 
+def _read_inbox_emails(inbox_items, num_items):
+    """
+    Read the mail items among the first inbox items in one enumeration
+
+    The items are kept so they can be acted on after their content has been
+    analyzed as one batch, without fetching them from the inbox again.
+
+    Args:
+        inbox_items: Sorted Outlook Items collection of the inbox
+        num_items: Number of items from the start of the collection to read
+
+    Returns:
+        Tuple of (list of mail items, list of (subject, body, sender) tuples in the same order)
+    """
+    items = []
+    emails = []
+    for i, item in enumerate(iter_items(inbox_items, num_items), 1):
+        try:
+            if not hasattr(item, 'Class') or item.Class != 43:  # 43 = olMail
+                continue
+            emails.append(read_email_fields(item))
+            items.append(item)
+        except pywintypes.com_error as ce:
+            logger.debug(f"COM error reading content of inbox item {i}: {ce}")
+        except Exception as e:
+            logger.debug(f"Error reading content of inbox item {i}: {e}")
+    return items, emails
+
+def _analyze_inbox_content(inbox_items, num_items, config, llm=None):
+    """
+    Read the first inbox items and analyze their content as one batch
+
+    Topic extraction is fitted once over the batch rather than once per email.
+
+    Args:
+        inbox_items: Sorted Outlook Items collection of the inbox
+        num_items: Number of items from the start of the collection to analyze
+        config: Configuration dictionary
+        llm: Optional LLM service for content analysis
+
+    Returns:
+        Tuple of (list of mail items, list of their content analyses in the same order)
+    """
+    items, emails = _read_inbox_emails(inbox_items, num_items)
+    logger.info(f"Analyzing content of {len(emails)} emails...")
+    return items, process_emails_content(emails, llm, config)
+
 def organize_inbox(inbox, sender_scores, email_patterns, config, llm=None, email_tracking=None, limit=None, dry_run=True):
     """
     Organize inbox based on behavior patterns
@@ -56,6 +104,10 @@ def organize_inbox(inbox, sender_scores, email_patterns, config, llm=None, email
     num_items_to_process = total_inbox_count if limit is None else min(total_inbox_count, limit)
     logger.info(f"Found {total_inbox_count} items in Inbox. Processing up to {num_items_to_process}.")
 
+    # Read and analyze content up front, before any items move. Items are acted on
+    # from this list, so moves don't shift the ones still to be processed.
+    items, analyses = _analyze_inbox_content(inbox_items, num_items_to_process, config, llm)
+
     # Create counters for statistics
     stats = {
         'processed': 0, 'moved': 0, 'flagged': 0, 'task_created': 0,
@@ -68,16 +120,10 @@ def organize_inbox(inbox, sender_scores, email_patterns, config, llm=None, email
     processed_ids = set()  # Keep track of processed items to avoid potential duplicates if list changes
 
     # Process inbox items
-    for i in range(num_items_to_process):
-        item = None # Initialize for finally block
+    for i, content_analysis in enumerate(analyses):
+        item = items[i]
+        items[i] = None  # Drop the list's reference; the finally block releases item
         try:
-            # Check if index is still valid after potential moves
-            if (i+1) > inbox_items.Count:
-                logger.warning(f"Index {i+1} out of bounds after item moves. Stopping processing.")
-                break
-
-            item = inbox_items.Item(i+1)  # 1-based indexing
-
             # Basic check for valid item and EntryID
             if item is None or not hasattr(item, 'EntryID') or not item.EntryID:
                 logger.debug(f"Skipping invalid item at index {i+1}.")
@@ -88,10 +134,6 @@ def organize_inbox(inbox, sender_scores, email_patterns, config, llm=None, email
             if entry_id in processed_ids:
                 continue
 
-            # Skip non-email items
-            if not hasattr(item, 'Class') or item.Class != 43:  # 43 = olMail
-                continue
-
             # Skip if already in a subfolder of the Inbox
             try:
                 parent_folder = item.Parent
@@ -105,7 +147,8 @@ def organize_inbox(inbox, sender_scores, email_patterns, config, llm=None, email
                 continue  # Skip if parent check fails
 
             # Get recommendation
-            recommendation = recommend_action(item, sender_scores, email_patterns, config, llm, email_tracking)
+            recommendation = recommend_action(item, sender_scores, email_patterns, config, llm, email_tracking,
+                                              content_analysis)
 
             if not recommendation:
                 stats['errors'] += 1
@@ -275,21 +318,19 @@ def get_recommendations_report(inbox, sender_scores, email_patterns, config, llm
     num_items_to_process = min(total_inbox_count, limit)
     logger.info(f"Found {total_inbox_count} items in Inbox. Processing up to {num_items_to_process}.")
 
+    items, analyses = _analyze_inbox_content(inbox_items, num_items_to_process, config, llm)
+
     # Prepare data collection
     recommendations_data = []
 
     # Process inbox items
-    for i in range(num_items_to_process):
-        item = None # Initialize for finally block
+    for i, content_analysis in enumerate(analyses):
+        item = items[i]
+        items[i] = None  # Drop the list's reference; the finally block releases item
         try:
-            item = inbox_items.Item(i+1)  # 1-based indexing
-
-            # Skip non-email items
-            if not hasattr(item, 'Class') or item.Class != 43:  # 43 = olMail
-                continue
-
             # Get recommendation
-            recommendation = recommend_action(item, sender_scores, email_patterns, config, llm, email_tracking)
+            recommendation = recommend_action(item, sender_scores, email_patterns, config, llm, email_tracking,
+                                              content_analysis)
 
             if not recommendation:
                 logger.warning(f"Could not get recommendation for item: {getattr(item, 'Subject', 'N/A')}")
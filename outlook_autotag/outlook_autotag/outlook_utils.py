@@ -112,7 +112,9 @@ def get_search_key(item) -> bytes:
 # --- Outlook object helpers ---
 def iter_sent_folders(scan_all=True):
     if scan_all:
-        for store in session.Stores:
+        stores = session.Stores
+        for i in range(1, stores.Count + 1):
+            store = stores.Item(i)
             try:
                 f = store.GetDefaultFolder(constants.olFolderSentMail)
                 yield f, store.DisplayName
@@ -124,7 +126,9 @@ def iter_sent_folders(scan_all=True):
 def recipients_from_mail(item):
     tos, ccs = set(), set()
     try:
-        for r in item.Recipients:
+        rcpts = item.Recipients
+        for i in range(1, rcpts.Count + 1):
+            r = rcpts.Item(i)
             smtp = resolve_smtp(r.AddressEntry)
             if not smtp or smtp == ME:
                 continue
@@ -144,7 +148,9 @@ def restrict_by_senton(items, start_local_dt: dt.datetime):
 def attendees_from_appt(appt):
     req, opt = [], []
     try:
-        for r in appt.Recipients:
+        rcpts = appt.Recipients
+        for i in range(1, rcpts.Count + 1):
+            r = rcpts.Item(i)
             smtp = resolve_smtp(r.AddressEntry)
             if not smtp or smtp == ME or r.Type == 3:
                 continue  # skip self + rooms/resources
@@ -67,7 +67,9 @@ def sender_smtp(mail_item) -> Optional[str]:
 def recipients_smtp_list(mail_item) -> Tuple[List[str], List[str]]:
     to_list, cc_list = [], []
     try:
-        for r in mail_item.Recipients:
+        rcpts = mail_item.Recipients
+        for i in range(1, rcpts.Count + 1):
+            r = rcpts.Item(i)
             # MailItem.Recipients returns recipients across To/CC/BCC; we need split by Type:
             # 1 = To, 2 = CC, 3 = BCC
             rtype = getattr(r, "Type", 1)
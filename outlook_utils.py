@@ -14,11 +14,17 @@ olFolderArchive = 23
 # Rule constants
 olRuleReceive = 0
 
-def connect_to_outlook():
+def connect_to_outlook(early_bound=False):
     """
     Establish connection to Outlook application and return namespace.
     Tries to connect to an active instance first.
 
+    Args:
+        early_bound (bool): Wrap the application in makepy-generated classes so property
+            reads dispatch by DISPID instead of a name lookup per call. Early-bound objects
+            resolve property names case-sensitively (e.g. 'UnRead', not 'Unread'), so only
+            callers that use the exact type library names should enable this.
+
     Returns:
         tuple: (outlook_app, namespace) or (None, None) on failure.
     """
@@ -35,6 +41,13 @@ def connect_to_outlook():
              logger.warning(f"Error trying GetActiveObject: {get_active_err}. Attempting Dispatch...")
              outlook = win32com.client.Dispatch("Outlook.Application")
 
+        if early_bound:
+            try:
+                outlook = win32com.client.gencache.EnsureDispatch(outlook._oleobj_)
+                logger.info("Using early-bound Outlook type library.")
+            except Exception as gen_err:
+                logger.warning(f"Could not generate Outlook type library wrappers: {gen_err}. Using late binding.")
+
         namespace = outlook.GetNamespace("MAPI")
 
         # Log account information
@@ -102,7 +115,9 @@ def get_folder_by_path(namespace, folder_path_str, store_name=None):
         if store_name:
             # Find specific store
             target_store = None
-            for store in namespace.Stores:
+            stores = namespace.Stores
+            for i in range(1, stores.Count + 1):
+                store = stores.Item(i)
                 if store.DisplayName == store_name:
                     target_store = store
                     break
@@ -156,6 +171,102 @@ def safe_get_property(item, property_name, default=None):
         logger.warning(f"Unexpected error accessing property '{property_name}': {e}")
         return default
 
+def iter_items(items, limit=None, reverse=False):
+    """
+    Yield the objects of an Outlook Items collection in order with GetFirst/GetNext.
+
+    Unlike Items.Item(i), which can cost O(i) on large or restricted collections,
+    each GetNext call is O(1).
+
+    Args:
+        items: Outlook Items collection (already sorted/restricted as needed).
+        limit (int, optional): Maximum number of objects to yield. None yields all.
+        reverse (bool): Walk from the end with GetLast/GetPrevious instead.
+    """
+    get_first, get_next = (items.GetLast, items.GetPrevious) if reverse else (items.GetFirst, items.GetNext)
+    count = 0
+    try:
+        item = get_first()
+        while item is not None and (limit is None or count < limit):
+            count += 1
+            yield item
+            item = get_next()
+    except pywintypes.com_error as ce:
+        logger.debug(f"COM error enumerating items after {count} objects: {ce}")
+
+def iter_mail_table(folder, columns, limit=None, restriction=None, sort_by="ReceivedTime", set_columns=False,
+                    sort_items=True):
+    """
+    Yield (row, item) for each mail item in a folder, newest first.
+
+    Rows are read through the Outlook Table API, so all requested columns of a row
+    come back in one GetValues call instead of one COM dispatch per property; item
+    is None for these rows (open it with namespace.GetItemFromID(row['EntryID'])
+    when a property the Table cannot return, such as Body or Recipients, is needed).
+    If the Table cannot be built, folder.Items is walked instead and the item
+    itself is yielded alongside its row.
+
+    Args:
+        folder: Outlook MAPIFolder.
+        columns (list): Outlook property names to read for each row.
+        limit (int, optional): Maximum number of rows to read (non-mail rows included).
+            None reads all.
+        restriction (str, optional): DASL/Jet filter applied before any rows are returned.
+        sort_by (str): Property to sort on, descending.
+        set_columns (bool): When walking Items, cache just the requested columns with
+            Items.SetColumns so items aren't fully opened. Only for callers that
+            don't read any other property from the yielded items.
+        sort_items (bool): Sort Items when walking them. False skips that full sort and
+            walks from the end (GetLast/GetPrevious) instead, which is newest first for
+            folders in arrival order - approximate, but cheap for large folders.
+    """
+    columns = list(columns)
+    if 'MessageClass' not in columns:
+        columns.append('MessageClass')
+
+    try:
+        table = folder.GetTable(restriction) if restriction else folder.GetTable()
+        table.Columns.RemoveAll()
+        for column in columns:
+            table.Columns.Add(column)
+        table.Sort(sort_by, True)
+    except Exception as e:
+        logger.debug(f"Outlook Table unavailable for '{getattr(folder, 'Name', '?')}', walking Items instead: {e}")
+        table = None
+
+    if table is not None:
+        count = 0
+        while not table.EndOfTable and (limit is None or count < limit):
+            count += 1
+            row = dict(zip(columns, table.GetNextRow().GetValues()))
+            if str(row['MessageClass']).startswith('IPM.Note'):  # Only mail items
+                yield row, None
+        return
+
+    items = folder.Items
+    if restriction:
+        items = items.Restrict(restriction)
+    if set_columns:
+        try:
+            items.SetColumns(", ".join(columns))
+        except Exception as e:
+            logger.debug(f"Could not set columns on items of '{getattr(folder, 'Name', '?')}': {e}")
+    if sort_items:
+        try:
+            items.Sort(f"[{sort_by}]", True)
+        except Exception as e:
+            logger.debug(f"Could not sort items of '{getattr(folder, 'Name', '?')}', reading them unsorted: {e}")
+    for i, item in enumerate(iter_items(items, limit, reverse=not sort_items), 1):
+        try:
+            # MessageClass rather than Class, which SetColumns doesn't cache
+            if not str(safe_get_property(item, 'MessageClass', '')).startswith('IPM.Note'):  # Only mail items
+                continue
+            row = {column: safe_get_property(item, column) for column in columns}
+        except Exception as e:
+            logger.debug(f"Error reading item {i} of '{getattr(folder, 'Name', '?')}': {e}")
+            continue
+        yield row, item
+
 def get_or_create_folder(parent_folder, folder_name):
     """
     Gets a subfolder by name. If it doesn't exist, it creates it.
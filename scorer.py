@@ -14,7 +14,7 @@ from content_processor import process_email_content
 
 logger = logging.getLogger(__name__)
 
-def score_email(email_item, sender_scores, email_patterns, config, llm=None, email_tracking=None):
+def score_email(email_item, sender_scores, email_patterns, config, llm=None, email_tracking=None, content_analysis=None):
     """
     Score an individual email based on behavior patterns
 
@@ -25,6 +25,7 @@ def score_email(email_item, sender_scores, email_patterns, config, llm=None, ema
         config: Configuration dictionary with scoring weights and thresholds
         llm: Optional LLM service for content analysis
         email_tracking: Optional dictionary of email tracking data to check for repeatedly ignored emails
+        content_analysis: Optional content analysis already computed for this email (e.g. by process_emails_content)
 
     Returns:
         Dictionary containing the final score, component scores, and metadata
@@ -68,8 +69,9 @@ def score_email(email_item, sender_scores, email_patterns, config, llm=None, ema
         # Get conversation ID
         conversation_id = getattr(email_item, 'ConversationID', None)
 
-        # Analyze content using hybrid approach
-        content_analysis = process_email_content(email_item, llm, config)
+        # Analyze content using hybrid approach, unless analyzed with its batch
+        if content_analysis is None:
+            content_analysis = process_email_content(email_item, llm, config)
 
         # --- Calculate Score Components ---
 
@@ -390,7 +392,7 @@ def score_email(email_item, sender_scores, email_patterns, config, llm=None, ema
         return None
 
 
-def recommend_action(email_item, sender_scores, email_patterns, config, llm=None, email_tracking=None):
+def recommend_action(email_item, sender_scores, email_patterns, config, llm=None, email_tracking=None, content_analysis=None):
     """
     Recommend action for an email based on score and patterns
 
@@ -401,12 +403,13 @@ def recommend_action(email_item, sender_scores, email_patterns, config, llm=None
         config: Configuration dictionary with scoring weights and thresholds
         llm: Optional LLM service for content analysis and folder suggestions
         email_tracking: Dictionary of email tracking history
+        content_analysis: Optional content analysis already computed for this email
 
     Returns:
         Dictionary containing the recommended actions and score data
     """
     # Score the email
-    score_data = score_email(email_item, sender_scores, email_patterns, config, llm, email_tracking)
+    score_data = score_email(email_item, sender_scores, email_patterns, config, llm, email_tracking, content_analysis)
 
     if not score_data:
         return None  # Cannot recommend if scoring failed
@@ -0,0 +1,39 @@
+"""
+Tests for loading the configuration file on top of the defaults
+"""
+
+import json
+import tempfile
+from pathlib import Path
+
+from config import DEFAULT_CONFIG, load_config
+
+def test_partial_nested_override_keeps_defaults():
+    """A partial llm_config.copilot_proxy override keeps the other copilot_proxy defaults"""
+    user_config = {
+        'sender_weight': 0.6,
+        'llm_config': {
+            'model': 'override-model',
+            'copilot_proxy': {'work_dir': './my_copilot_work'}
+        }
+    }
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        config_path = Path(tmp_dir) / 'config.json'
+        config_path.write_text(json.dumps(user_config))
+        config = load_config(config_path)
+
+    copilot_proxy = config['llm_config']['copilot_proxy']
+    assert copilot_proxy['work_dir'] == './my_copilot_work'
+    assert copilot_proxy['wait_time'] == DEFAULT_CONFIG['llm_config']['copilot_proxy']['wait_time']
+    assert copilot_proxy['use_cache'] is True
+    assert config['llm_config']['model'] == 'override-model'
+    assert config['llm_config']['max_tokens'] == DEFAULT_CONFIG['llm_config']['max_tokens']
+    assert config['sender_weight'] == 0.6
+
+    # The override must not leak into the defaults used by later loads
+    assert DEFAULT_CONFIG['llm_config']['model'] == 'local-model'
+    assert DEFAULT_CONFIG['llm_config']['copilot_proxy']['work_dir'] == './copilot_work'
+
+if __name__ == "__main__":
+    test_partial_nested_override_keeps_defaults()
+    print("Config tests passed")
@@ -0,0 +1,113 @@
+"""
+Tests for the SQLite-backed email tracking store
+"""
+
+import datetime
+import pickle
+
+import pytest
+
+from tracking_store import EmailTrackingStore, open_email_tracking
+
+def _record(**overrides):
+    record = {
+        'subject': 'Quarterly report',
+        'sender': 'alice@example.com',
+        'received_time': datetime.datetime(2024, 3, 1, 9, 30, 15),
+        'last_checked': datetime.datetime(2024, 3, 2, 8, 0, 0),
+        'first_opened_time': None,
+        'is_currently_read': False,
+        'check_count': 2,
+    }
+    record.update(overrides)
+    return record
+
+def _record_without_none(record):
+    """The record as read back: None fields are not stored"""
+    return {key: value for key, value in record.items() if value is not None}
+
+def test_round_trip_keeps_times_none_and_extra_fields(tmp_path):
+    """Datetimes come back as naive datetimes, None times are left out and unknown keys survive"""
+    store = EmailTrackingStore(tmp_path / 'email_tracking.db')
+    store['id1'] = _record(tags=['work', 'q1'])
+
+    record = store['id1']
+    assert record['received_time'] == datetime.datetime(2024, 3, 1, 9, 30, 15)
+    assert record['last_checked'] == datetime.datetime(2024, 3, 2, 8, 0, 0)
+    assert 'first_opened_time' not in record
+    assert record.get('first_opened_time') is None
+    assert record['is_currently_read'] is False
+    assert record['check_count'] == 2
+    assert record['tags'] == ['work', 'q1']
+
+    # Aware datetimes are stored as UTC
+    utc_plus_2 = datetime.timezone(datetime.timedelta(hours=2))
+    store['id2'] = _record(received_time=datetime.datetime(2024, 3, 1, 11, 30, 15, tzinfo=utc_plus_2))
+    assert store['id2']['received_time'] == datetime.datetime(2024, 3, 1, 9, 30, 15)
+
+    # Records persist across connections
+    store.close()
+    reopened = open_email_tracking(tmp_path)
+    assert reopened['id1'] == record
+    assert dict(reopened.items())['id1'] == record
+    reopened.close()
+
+def test_get_many_spans_several_batches(tmp_path):
+    """get_many finds every tracked id when the ids span more than one IN (...) query"""
+    store = EmailTrackingStore(tmp_path / 'email_tracking.db')
+    store.update({f'id{i}': _record(check_count=i) for i in range(1200)})
+
+    wanted = [f'id{i}' for i in range(0, 1200, 2)] + ['missing', 'id0']
+    records = store.get_many(wanted)
+
+    assert len(records) == 600
+    assert 'missing' not in records
+    assert all(records[f'id{i}']['check_count'] == i for i in range(0, 1200, 2))
+    assert len(store) == 1200
+
+def test_touch_only_changes_last_checked(tmp_path):
+    """touch updates last_checked on existing records and ignores unknown ids"""
+    store = EmailTrackingStore(tmp_path / 'email_tracking.db')
+    store['id1'] = _record(tags=['work'])
+    checked = datetime.datetime(2024, 4, 1, 12, 0, 0)
+
+    store.touch(['id1', 'missing'], checked)
+
+    assert store['id1'] == _record_without_none(_record(tags=['work'], last_checked=checked))
+    assert 'missing' not in store
+
+def test_delete_and_truthiness(tmp_path):
+    """An empty store is falsy; deleting removes the row and unknown ids raise KeyError"""
+    store = EmailTrackingStore(tmp_path / 'email_tracking.db')
+    assert not store
+    assert len(store) == 0
+
+    store['id1'] = _record()
+    assert store
+    assert 'id1' in store
+
+    del store['id1']
+    assert 'id1' not in store
+    assert not store
+    with pytest.raises(KeyError):
+        del store['id1']
+    with pytest.raises(KeyError):
+        store['id1']
+
+def test_open_without_database(tmp_path):
+    """open_email_tracking returns None when nothing has been tracked yet"""
+    assert open_email_tracking(tmp_path) is None
+
+def test_legacy_pickle_is_imported_once(tmp_path):
+    """EmailAnalyzer imports email_tracking.pkl into a newly created store"""
+    pytest.importorskip('win32com')
+    from analyzer import EmailAnalyzer
+
+    with open(tmp_path / 'email_tracking.pkl', 'wb') as f:
+        pickle.dump({'id1': _record(tags=['work'])}, f)
+
+    analyzer = EmailAnalyzer(None, None, None, {}, tmp_path)
+    store = analyzer.email_tracking
+    assert (tmp_path / 'email_tracking.db').exists()
+    assert store['id1'] == _record_without_none(_record(tags=['work']))
+    store.close()
@@ -0,0 +1,213 @@
+import calendar
+import datetime
+import logging
+import pickle
+import sqlite3
+from collections.abc import MutableMapping
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Text/number fields of a tracking record, in table column order
+TEXT_FIELDS = ('subject', 'sender', 'raw_sender', 'sender_name', 'sender_email', 'folder_path')
+# Timestamp fields, stored as INTEGER UTC epoch seconds
+TIME_FIELDS = ('received_time', 'last_modified', 'last_checked', 'first_opened_time', 'sent_on_time')
+FIELDS = TEXT_FIELDS + TIME_FIELDS + ('is_currently_read', 'check_count')
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS tracking ("
+    "entry_id TEXT PRIMARY KEY, "
+    + ", ".join(f"{name} TEXT" for name in TEXT_FIELDS) + ", "
+    + ", ".join(f"{name} INTEGER" for name in TIME_FIELDS) + ", "
+    "is_currently_read INTEGER, check_count INTEGER, "
+    "extra BLOB)"  # Pickled dict of any fields not listed above
+)
+_COLUMNS = ", ".join(FIELDS) + ", extra"
+_SELECT_ALL = f"SELECT entry_id, {_COLUMNS} FROM tracking"
+_SELECT_ONE = f"SELECT entry_id, {_COLUMNS} FROM tracking WHERE entry_id = ?"
+_UPSERT = (f"INSERT OR REPLACE INTO tracking (entry_id, {_COLUMNS}) "
+           f"VALUES ({', '.join('?' * (len(FIELDS) + 2))})")
+
+
+def _encode_time(value):
+    """Convert a datetime to UTC epoch seconds. Naive datetimes are taken as UTC."""
+    if value is None:
+        return None
+    if value.tzinfo is not None:
+        return int(value.timestamp())
+    return calendar.timegm(value.timetuple())
+
+
+def _decode_time(value):
+    """Convert UTC epoch seconds back to a naive datetime."""
+    if value is None:
+        return None
+    return _EPOCH + datetime.timedelta(seconds=value)
+
+
+class EmailTrackingStore(MutableMapping):
+    """
+    Dict-like view of the email tracking records ({entry_id: record}) backed by an
+    SQLite database in WAL mode.
+
+    Assigning a record upserts that single row, so saving costs the same regardless
+    of how many emails have been tracked. Records read back are new dicts: changes
+    to a returned record must be assigned again to be stored.
+    """
+
+    def __init__(self, db_path):
+        """
+        Open (creating if needed) the tracking database.
+
+        Args:
+            db_path (str or Path): Path to the SQLite database file.
+        """
+        self.db_path = Path(db_path)
+        # Autocommit; batch writes explicitly with begin()/commit()
+        self._conn = sqlite3.connect(str(self.db_path), isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+
+    @staticmethod
+    def _row_to_record(row):
+        """Convert a table row (without entry_id) to a tracking record dict."""
+        # NULL columns are left out, so record.get(key, default) behaves as for the original dict
+        record = {key: value for key, value in zip(FIELDS, row) if value is not None}
+        for key in TIME_FIELDS:
+            if key in record:
+                record[key] = _decode_time(record[key])
+        if 'is_currently_read' in record:
+            record['is_currently_read'] = bool(record['is_currently_read'])
+        extra = row[-1]
+        if extra is not None:
+            record.update(pickle.loads(extra))
+        return record
+
+    @staticmethod
+    def _record_to_row(entry_id, record):
+        """Convert a tracking record dict to a table row."""
+        row = [entry_id]
+        row.extend(record.get(key) for key in TEXT_FIELDS)
+        for key in TIME_FIELDS:
+            value = record.get(key)
+            if value is not None and not isinstance(value, datetime.datetime):
+                logger.warning(f"Non-datetime value for {key} in {entry_id}: {type(value)}. Setting to None.")
+                value = None
+            row.append(_encode_time(value))
+        is_read = record.get('is_currently_read')
+        row.append(None if is_read is None else int(bool(is_read)))
+        row.append(record.get('check_count'))
+        extra = {key: value for key, value in record.items() if key not in FIELDS}
+        row.append(pickle.dumps(extra, protocol=pickle.HIGHEST_PROTOCOL) if extra else None)
+        return row
+
+    def __getitem__(self, entry_id):
+        row = self._conn.execute(_SELECT_ONE, (entry_id,)).fetchone()
+        if row is None:
+            raise KeyError(entry_id)
+        return self._row_to_record(row[1:])
+
+    def __setitem__(self, entry_id, record):
+        self._conn.execute(_UPSERT, self._record_to_row(entry_id, record))
+
+    def __delitem__(self, entry_id):
+        if self._conn.execute("DELETE FROM tracking WHERE entry_id = ?", (entry_id,)).rowcount == 0:
+            raise KeyError(entry_id)
+
+    def __contains__(self, entry_id):
+        return self._conn.execute("SELECT 1 FROM tracking WHERE entry_id = ?", (entry_id,)).fetchone() is not None
+
+    def __iter__(self):
+        return (row[0] for row in self._conn.execute("SELECT entry_id FROM tracking"))
+
+    def __len__(self):
+        return self._conn.execute("SELECT COUNT(*) FROM tracking").fetchone()[0]
+
+    def __bool__(self):
+        # Without this, truth tests fall back to __len__ and count the whole table
+        return self._conn.execute("SELECT 1 FROM tracking LIMIT 1").fetchone() is not None
+
+    # The mixin versions issue one query per record; read everything in one pass instead
+    def items(self):
+        return [(row[0], self._row_to_record(row[1:])) for row in self._conn.execute(_SELECT_ALL)]
+
+    def values(self):
+        return [self._row_to_record(row[1:]) for row in self._conn.execute(_SELECT_ALL)]
+
+    def get_many(self, entry_ids, batch_size=500):
+        """
+        Fetch the records for many entry ids with a few IN (...) queries.
+
+        Args:
+            entry_ids (iterable): Entry ids to look up.
+            batch_size (int): Ids per query (kept under SQLite's bound-parameter limit).
+
+        Returns:
+            dict: entry_id -> record for the ids that are tracked.
+        """
+        entry_ids = list(dict.fromkeys(entry_ids))
+        records = {}
+        for start in range(0, len(entry_ids), batch_size):
+            batch = entry_ids[start:start + batch_size]
+            query = f"{_SELECT_ALL} WHERE entry_id IN ({', '.join('?' * len(batch))})"
+            for row in self._conn.execute(query, batch):
+                records[row[0]] = self._row_to_record(row[1:])
+        return records
+
+    def touch(self, entry_ids, last_checked):
+        """
+        Set last_checked on existing records without rewriting the rest of each row.
+
+        Args:
+            entry_ids (iterable): Entry ids of the records to update.
+            last_checked (datetime): New last_checked time.
+        """
+        value = _encode_time(last_checked)
+        self._conn.executemany("UPDATE tracking SET last_checked = ? WHERE entry_id = ?",
+                               ((value, entry_id) for entry_id in entry_ids))
+
+    def update(self, records=(), **kwargs):
+        """Upsert many records in a single statement batch and transaction."""
+        if hasattr(records, 'items'):
+            records = records.items()
+        rows = [self._record_to_row(entry_id, record) for entry_id, record in records]
+        rows.extend(self._record_to_row(entry_id, record) for entry_id, record in kwargs.items())
+        started = not self._conn.in_transaction
+        self.begin()
+        self._conn.executemany(_UPSERT, rows)
+        if started:
+            self.commit()
+
+    def begin(self):
+        """Start a transaction so the following writes are committed together."""
+        if not self._conn.in_transaction:
+            self._conn.execute("BEGIN")
+
+    def commit(self):
+        """Commit the pending transaction, if any."""
+        if self._conn.in_transaction:
+            self._conn.execute("COMMIT")
+
+    def close(self):
+        """Commit pending writes and close the database."""
+        self.commit()
+        self._conn.close()
+
+
+def open_email_tracking(data_dir):
+    """
+    Open the email tracking store in data_dir for reading, if it exists.
+
+    Args:
+        data_dir (str or Path): Directory holding the analysis data.
+
+    Returns:
+        EmailTrackingStore or None: The store, or None if no tracking database exists.
+    """
+    db_path = Path(data_dir) / 'email_tracking.db'
+    if not db_path.exists():
+        return None
+    return EmailTrackingStore(db_path)